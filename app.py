@@ -1,7 +1,81 @@
 # Entrypoint para Vercel
-# Importa o app Flask do app_web.py
-from app_web import app
+# Importa o app Flask do app_web.py sob demanda, na primeira requisição,
+# para que o cold start não pague o custo de importação do app_web
+import logging
+import os
+import threading
+import traceback
+
+logger = logging.getLogger(__name__)
+
+_app = None
+_failed = False
+_err_text = None
+_err_html = None
+# Garante uma única importação mesmo com várias primeiras requisições simultâneas
+_import_lock = threading.Lock()
+
+
+def _get_app():
+    global _app, _failed, _err_text
+    if _app is None and not _failed:
+        with _import_lock:
+            # Confere de novo: outra thread pode ter concluído a importação enquanto esta esperava
+            if _app is None and not _failed:
+                try:
+                    from app_web import app as flask_app
+                    _app = flask_app
+                    if os.environ.get('DEBUG_IMPORT'):
+                        logging.basicConfig(level=logging.INFO)
+                        logger.info('app_web importado com sucesso')
+                except Exception as e:
+                    # Logging só é configurado quando há erro a registrar
+                    logging.basicConfig(level=logging.INFO)
+                    logger.error('Erro ao importar app_web: %s', e, exc_info=True)
+                    # O traceback só vai para a página de erro com DEBUG_IMPORT ligado
+                    if os.environ.get('DEBUG_IMPORT'):
+                        _err_text = f"{e}\n\n{traceback.format_exc()}"
+                    # Libera os frames da exceção
+                    e.__traceback__ = None
+                    # _failed por último: quem lê sem o lock já encontra _err_text pronto
+                    _failed = True
+    return _app
+
+
+def _error_body():
+    """
+    Monta a página de erro só na primeira resposta de erro.
+    
+    Sem DEBUG_IMPORT a página é genérica; o traceback fica apenas no log.
+    """
+    global _err_html
+    if _err_html is None:
+        if _err_text is None:
+            _err_html = (
+                '<h1>Erro interno</h1><p>O aplicativo não pôde ser iniciado.</p>'.encode('utf-8')
+            )
+        else:
+            from markupsafe import escape
+            _err_html = (
+                '<h1>Erro de Importação</h1><pre>'.encode('utf-8')
+                + str(escape(_err_text)).encode('utf-8')
+                + b'</pre>'
+            )
+    return _err_html
+
+
+def app(environ, start_response):
+    """Callable WSGI exportado para o Vercel; delega ao app Flask real."""
+    flask_app = _get_app()
+    if flask_app is None:
+        body = _error_body()
+        start_response('500 INTERNAL SERVER ERROR', [
+            ('Content-Type', 'text/html; charset=utf-8'),
+            ('Content-Length', str(len(body)))
+        ])
+        return [body]
+    return flask_app(environ, start_response)
+
 
 # Exporta o app para o Vercel
 __all__ = ['app']
-
@@ -5,9 +5,10 @@ from flask_limiter.util import get_remote_address
 import pandas as pd
 import numpy as np
 import os
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import io
 import json
+import tempfile
 import requests
 import re
 import unicodedata
@@ -15,20 +16,37 @@ from collections import defaultdict
 from google.oauth2 import service_account
 from googleapiclient.discovery import build
 from googleapiclient.http import MediaIoBaseDownload
+import google_auth_httplib2
+import httplib2
 import hashlib
 import gc
 import logging
 from logging.handlers import RotatingFileHandler
-from functools import wraps
+from functools import wraps, lru_cache
 from typing import Optional, Dict, Any, Tuple, List
 import traceback
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import threading
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Performance: python-calamine (Rust) lê .xlsx bem mais rápido que openpyxl
+# Atenção: o calamine devolve células só com espaços (" ") como vazias, que o pandas
+# lê como NaN; o openpyxl as mantinha como texto. Ex.: status " " vira "Sem Status".
+try:
+    import python_calamine  # noqa: F401
+    EXCEL_ENGINE = 'calamine'
+except ImportError:
+    EXCEL_ENGINE = 'openpyxl'
+
 # Clean Code: Sistema de logging estruturado
+# Performance: mensagens de diagnóstico do pipeline são DEBUG; LOG_LEVEL=DEBUG as exibe
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv('LOG_LEVEL', 'INFO').upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         RotatingFileHandler(
@@ -57,7 +75,11 @@ app.jinja_env.cache = {}
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
 
-# Performance: Compressão gzip
+# Performance: Compressão das respostas (Brotli preferido; JSON tabular comprime 8-15x)
+app.config['COMPRESS_ALGORITHM'] = ['br', 'zstd', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_MIN_SIZE'] = 2048
 Compress(app)
 
 # Performance: Rate limiting para proteção contra abuso
@@ -80,16 +102,37 @@ CACHE_TTL_BY_TYPE = {
     'leads': 300,        # 5 minutos para leads
     'sults': 300,        # 5 minutos para dados SULTS
     'analysis': 600,     # 10 minutos para análises
+    'raw_data': 600,     # 10 minutos para o DataFrame paginado em /raw-data
     'default': 300       # 5 minutos padrão
 }
 CACHE_TTL_SECONDS = 300  # 5 minutos (mantido para compatibilidade)
-CACHE_MAX_ENTRIES = 10  # Máximo de 10 entradas no cache
+# Máximo de entradas no cache; cada upload ocupa duas (resposta + DataFrame de /raw-data),
+# então cabem ~10 uploads recentes antes de a chave de /raw-data ser despejada
+CACHE_MAX_ENTRIES = 20
+# Teto de memória (aproximada, memory_usage(deep=True)) dos DataFrames em cache para
+# /raw-data: acima dele os mais antigos são despejados, mesmo com entradas sobrando
+CACHE_MAX_DATAFRAME_BYTES = 64 * 1024 * 1024  # 64MB
 MAX_ROWS_FOR_PROCESSING = 50000
 MAX_ROWS_FOR_JSON = 2000
 MAX_ROWS_FOR_FALLBACK = 500
+STREAM_CHUNK_ROWS = 250  # Linhas por bloco em /raw-data?format=ndjson
+MAX_ROWS_FOR_NDJSON = 20000  # Teto de linhas por resposta de /raw-data?format=ndjson
+# Colunas de métricas cujos nulos são serializados como 0.0
+NUMERIC_KEYWORDS = ('CPL', 'CPMQL', 'CPC', 'CPM', 'CTR', 'LEAD', 'MQL',
+                    'INVESTIMENTO', 'CLIQUES', 'IMPRESSÕES')
+# Performance: uma única busca por regex em vez de um teste de substring por palavra-chave
+NUMERIC_COL_RE = re.compile('|'.join(map(re.escape, NUMERIC_KEYWORDS)))
+# Métricas de custo/taxa (nome em maiúsculas) preenchidas com 0 junto de leads/MQLs
+RATIO_COL_RE = re.compile(r'CPL|CPMQL|CPC|CPM|CTR')
 # Performance: Streaming para arquivos grandes
 STREAMING_CHUNK_SIZE = 1024 * 1024  # 1MB por chunk
 MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB - arquivos maiores usam streaming
+DRIVE_SPOOL_MAX_BYTES = 8 * 1024 * 1024  # 8MB - downloads maiores vão para arquivo temporário
+GOOGLE_API_TIMEOUT_SECONDS = 30  # Timeout de socket das chamadas às APIs do Google
+# modifiedTime do Drive reaproveitado por este tempo: um arquivo alterado no Drive
+# aparece nas rotas automáticas com até 1 minuto de atraso, em troca de não fazer
+# uma chamada de metadados a cada requisição
+DRIVE_MODIFIED_TIME_TTL_SECONDS = 60
 
 # Validação de dados
 MAX_FILE_SIZE_MB = 16
@@ -183,6 +226,20 @@ def _get_from_cache(key: Optional[str], cache_type: str = 'default') -> Optional
         logger.error(f"Erro ao recuperar do cache: {e}", exc_info=True)
         return None
 
+def _evict_cached_dataframes(budget: int) -> None:
+    """Despeja os DataFrames mais antigos do cache até o tamanho somado caber em budget bytes."""
+    sized = sorted(
+        (entry['timestamp'], key, entry['size'])
+        for key, entry in _DATA_CACHE.items() if 'size' in entry
+    )
+    total = sum(size for _, _, size in sized)
+    for _, key, size in sized:
+        if total <= budget:
+            break
+        del _DATA_CACHE[key]
+        total -= size
+        logger.debug("DataFrame despejado do cache por tamanho: %s...", key[:20])
+
 def _save_to_cache(key: Optional[str], data: Any, cache_type: str = 'default') -> bool:
     """
     Salva dados no cache com tipo para TTL diferenciado.
@@ -201,12 +258,21 @@ def _save_to_cache(key: Optional[str], data: Any, cache_type: str = 'default') -
     try:
         _clear_old_cache()
         ttl = CACHE_TTL_BY_TYPE.get(cache_type, CACHE_TTL_BY_TYPE['default'])
-        _DATA_CACHE[key] = {
+        entry = {
             'data': data,
             'timestamp': datetime.now(),
             'type': cache_type,
             'ttl': ttl
         }
+        if isinstance(data, pd.DataFrame):
+            # DataFrames inteiros contam contra CACHE_MAX_DATAFRAME_BYTES, não só contra o nº de entradas
+            entry['size'] = int(data.memory_usage(deep=True).sum())
+            if entry['size'] > CACHE_MAX_DATAFRAME_BYTES:
+                logger.info("DataFrame de %d bytes excede o teto do cache; não será cacheado", entry['size'])
+                return False
+        _DATA_CACHE[key] = entry
+        if 'size' in entry:
+            _evict_cached_dataframes(CACHE_MAX_DATAFRAME_BYTES)
         logger.debug(f"Dados salvos no cache: {key[:20]}... (tipo: {cache_type}, TTL: {ttl}s)")
         return True
     except Exception as e:
@@ -241,6 +307,40 @@ def handle_errors(f):
     return wrapper
 
 
+def json_response(payload: Any, status: int = 200) -> Response:
+    """
+    Monta resposta JSON para payloads grandes.
+    
+    Performance: orjson serializa tipos numpy direto em C; sem ele, usa jsonify.
+    """
+    return app.response_class(_json_bytes(payload), status=status, mimetype='application/json')
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Fallback de serialização com datas no mesmo formato ISO 8601 do orjson.
+    
+    Sem ele, pd.Timestamp (e qualquer data sem orjson) cairia no encoder do Flask
+    e sairia como HTTP-date, enquanto datetime/date do orjson saem em ISO.
+    """
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    if isinstance(value, (datetime, date)):
+        return None if pd.isna(value) else value.isoformat()
+    return app.json.default(value)
+
+
+def _json_bytes(payload: Any) -> bytes:
+    """Serializa payload em bytes JSON (orjson quando disponível, senão o encoder do Flask)."""
+    if orjson is None:
+        return app.json.dumps(payload, default=_json_default).encode('utf-8')
+    return orjson.dumps(
+        payload,
+        default=_json_default,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    )
+
+
 def validate_file_upload(file) -> Tuple[bool, Optional[str]]:
     """
     Valida arquivo enviado.
@@ -448,7 +548,7 @@ def async_upload():
         if file.filename.endswith('.csv'):
             df = pd.read_csv(file_like, dtype=str, low_memory=False, engine='c')
         else:
-            df = pd.read_excel(file_like, engine='openpyxl', dtype=str)
+            df = pd.read_excel(file_like, engine=EXCEL_ENGINE, dtype=str)
         # Retorna análise (simplificado)
         return {'filename': file.filename, 'rows': len(df), 'columns': list(df.columns)}
     
@@ -485,28 +585,131 @@ def _make_unique_headers(headers):
     return normalized
 
 
+def _sheet_rows_to_frame(data_rows: List[List[Any]], header: List[str]) -> pd.DataFrame:
+    """
+    Monta o DataFrame de uma aba a partir das linhas da Sheets API.
+    
+    Performance: a API omite células vazias no fim da linha; em vez de completar
+    cada linha com listas novas, copia cada linha para uma matriz já preenchida
+    com '' e constrói o DataFrame uma única vez.
+    """
+    values = np.full((len(data_rows), len(header)), '', dtype=object)
+    for index, row in enumerate(data_rows):
+        values[index, :len(row)] = row
+    return pd.DataFrame(values, columns=header)
+
+
+# Transporte e clientes das APIs do Google por thread: httplib2.Http não é thread-safe
+_GOOGLE_CLIENTS = threading.local()
+
+
+def _thread_google_http(credentials) -> google_auth_httplib2.AuthorizedHttp:
+    """
+    Transporte autenticado da thread atual para as APIs do Google.
+    
+    Performance: cada thread tem um único httplib2.Http, guardado em _GOOGLE_CLIENTS
+    e compartilhado pelos clientes Drive e Sheets dessa thread; ele mantém a conexão
+    TLS aberta entre chamadas sequenciais (batchGet, metadados, download em blocos).
+    Não é um pool entre threads. O timeout evita que uma conexão travada prenda o
+    worker indefinidamente. Se a credencial mudar, o transporte é recriado.
+    """
+    http = getattr(_GOOGLE_CLIENTS, 'http', None)
+    if http is None or http.credentials is not credentials:
+        http = _GOOGLE_CLIENTS.http = google_auth_httplib2.AuthorizedHttp(
+            credentials, http=httplib2.Http(timeout=GOOGLE_API_TIMEOUT_SECONDS)
+        )
+    return http
+
+
+def _thread_google_client(api: str, version: str, credentials):
+    """
+    Cliente da API do Google para a thread atual, criado na primeira chamada.
+    
+    Performance: build() roda uma vez por thread e API, sobre o transporte da
+    própria thread. threading.local não sofre despejos com muitos workers nem herda
+    o cliente de uma thread já encerrada (ids de thread são reaproveitados).
+    Se a credencial mudar, o cliente é recriado.
+    """
+    clients = getattr(_GOOGLE_CLIENTS, 'clients', None)
+    if clients is None:
+        clients = _GOOGLE_CLIENTS.clients = {}
+    cached = clients.get(api)
+    if cached is None or cached[0] is not credentials:
+        service = build(api, version, http=_thread_google_http(credentials), cache_discovery=False)
+        cached = clients[api] = (credentials, service)
+    return cached[1]
+
+
+def _sheets_service(credentials):
+    """Cliente da Sheets API da thread atual, reaproveitado entre requisições."""
+    return _thread_google_client('sheets', 'v4', credentials)
+
+
+def _drop_blank_rows_and_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove linhas e colunas sem nenhum valor, tratando '' como vazio.
+    
+    Performance: uma única máscara de células preenchidas decide as linhas e
+    colunas mantidas (um iloc só); '' vira NA apenas nas células que sobram,
+    em vez de replace + dois dropna sobre a aba inteira.
+    """
+    values = df.to_numpy(dtype=object)
+    filled = pd.notna(values) & (values != '')
+    rows_keep = filled.any(axis=1)
+    cols_keep = filled.any(axis=0)
+    cleaned_df = df.iloc[rows_keep, cols_keep]
+    kept_filled = filled[np.ix_(rows_keep, cols_keep)]
+    if not kept_filled.all():
+        cleaned_df = cleaned_df.mask(~kept_filled)
+    return cleaned_df
+
+
+def _batch_get_sheet_values(sheets_service, spreadsheet_id: str, titles: List[str]) -> List[Dict[str, Any]]:
+    """
+    Busca os valores de várias abas em uma única chamada values().batchGet.
+    
+    Performance: uma requisição HTTP para todas as abas em vez de uma por aba
+    (menos latência e menos consumo da cota de leituras por minuto).
+    
+    Returns:
+        Lista de valueRanges, na mesma ordem de titles
+    """
+    if not titles:
+        return []
+    response = sheets_service.spreadsheets().values().batchGet(
+        spreadsheetId=spreadsheet_id,
+        ranges=titles
+    ).execute()
+    return response.get('valueRanges', [])
+
+
+def _titles_by_lower(titles) -> Dict[str, str]:
+    """Índice nome em minúsculas -> título original (em colisão, o primeiro título vence)."""
+    # Performance: cada nome prioritário vira uma consulta O(1), sem varrer todas as abas
+    index: Dict[str, str] = {}
+    for title in titles:
+        index.setdefault(title.lower(), title)
+    return index
+
+
 def load_leads_dataframe_from_google_sheets(spreadsheet_id, credentials, priority_names=None):
     """Carrega todas as abas diretamente da API do Google Sheets."""
-    sheets_service = build('sheets', 'v4', credentials=credentials)
+    sheets_service = _sheets_service(credentials)
     metadata = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
 
     priority_names = [name.strip().lower() for name in (priority_names or []) if name.strip()]
     frames_map = {}
     sheet_stats = []
 
-    for sheet in metadata.get('sheets', []):
-        properties = sheet.get('properties', {})
-        title = properties.get('title', f"Aba_{len(sheet_stats) + 1}")
-
-        values_response = sheets_service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=title
-        ).execute()
-
+    titles = [
+        sheet.get('properties', {}).get('title', f"Aba_{index + 1}")
+        for index, sheet in enumerate(metadata.get('sheets', []))
+    ]
+    for title, values_response in zip(titles, _batch_get_sheet_values(sheets_service, spreadsheet_id, titles)):
         values = values_response.get('values', [])
         if not values:
             sheet_stats.append({'name': title, 'rows': 0, 'columns': 0})
-            print(f"[LEADS][SheetsAPI] Aba '{title}' sem dados.")
+            logger.debug(f"[LEADS][SheetsAPI] Aba '{title}' sem dados.")
             continue
 
         header = _make_unique_headers(values[0])
@@ -517,23 +720,16 @@ def load_leads_dataframe_from_google_sheets(spreadsheet_id, credentials, priorit
 
         if not data_rows:
             sheet_stats.append({'name': title, 'rows': 0, 'columns': len(header)})
-            print(f"[LEADS][SheetsAPI] Aba '{title}' somente com cabeçalho.")
+            logger.debug(f"[LEADS][SheetsAPI] Aba '{title}' somente com cabeçalho.")
             continue
 
-        normalized_rows = []
-        for row in data_rows:
-            if len(row) < len(header):
-                row = row + [''] * (len(header) - len(row))
-            normalized_rows.append(row)
-
-        df_sheet = pd.DataFrame(normalized_rows, columns=header)
-        df_sheet.replace('', pd.NA, inplace=True)
-        cleaned_df = df_sheet.dropna(how='all').dropna(axis=1, how='all')
+        df_sheet = _sheet_rows_to_frame(data_rows, header)
+        cleaned_df = _drop_blank_rows_and_columns(df_sheet)
 
         rows = int(cleaned_df.shape[0])
         cols = int(cleaned_df.shape[1])
         sheet_stats.append({'name': title, 'rows': rows, 'columns': cols})
-        print(f"[LEADS][SheetsAPI] Aba '{title}' -> linhas: {rows}, colunas: {cols}")
+        logger.debug(f"[LEADS][SheetsAPI] Aba '{title}' -> linhas: {rows}, colunas: {cols}")
 
         if rows == 0 or cols == 0:
             continue
@@ -547,8 +743,9 @@ def load_leads_dataframe_from_google_sheets(spreadsheet_id, credentials, priorit
     matched_priority = []
     
     if priority_names:
+        titles_by_lower = _titles_by_lower(frames_map)
         for name in priority_names:
-            match = next((title for title in frames_map.keys() if title.lower() == name.lower()), None)
+            match = titles_by_lower.get(name.lower())
             if match and match not in ordered_titles:
                 ordered_titles.append(match)
                 matched_priority.append(match)
@@ -557,8 +754,8 @@ def load_leads_dataframe_from_google_sheets(spreadsheet_id, credentials, priorit
             ordered_titles.append(title)
 
     frames = [frames_map[title] for title in ordered_titles]
+    # Performance: cada aba já chega sem linhas vazias; um único concat, sem dropna/reset_index depois
     combined_df = pd.concat(frames, ignore_index=True, sort=False)
-    combined_df = combined_df.dropna(how='all').reset_index(drop=True)
     combined_rows = int(combined_df.shape[0])
 
     primary_sheet = matched_priority[0] if matched_priority else ordered_titles[0]
@@ -586,7 +783,7 @@ def load_google_ads_sheet(spreadsheet_id, credentials, preferred_sheets=None):
         preferred_sheets = ['Controle Google ADS', 'Controle Google ADS 2']
     
     preferred_sheets = [sheet.strip() for sheet in (preferred_sheets or []) if sheet and sheet.strip()]
-    sheets_service = build('sheets', 'v4', credentials=credentials)
+    sheets_service = _sheets_service(credentials)
     metadata = sheets_service.spreadsheets().get(spreadsheetId=spreadsheet_id).execute()
     
     sheet_titles = [sheet.get('properties', {}).get('title', '') for sheet in metadata.get('sheets', [])]
@@ -608,15 +805,8 @@ def load_google_ads_sheet(spreadsheet_id, credentials, preferred_sheets=None):
     frames = {}
     sheet_stats = []
     
-    for title in ordered_titles:
-        if not title:
-            continue
-        
-        values_response = sheets_service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=title
-        ).execute()
-        
+    titles = [title for title in ordered_titles if title]
+    for title, values_response in zip(titles, _batch_get_sheet_values(sheets_service, spreadsheet_id, titles)):
         values = values_response.get('values', [])
         if not values or len(values) <= 1:
             logger.debug(f"Aba '{title}' sem dados ou apenas cabeçalho")
@@ -628,15 +818,8 @@ def load_google_ads_sheet(spreadsheet_id, credentials, preferred_sheets=None):
         while len(header) < max_columns:
             header.append(f"Coluna_{len(header) + 1}")
         
-        normalized_rows = []
-        for row in data_rows:
-            if len(row) < len(header):
-                row = row + [''] * (len(header) - len(row))
-            normalized_rows.append(row)
-        
-        df_sheet = pd.DataFrame(normalized_rows, columns=header)
-        df_sheet.replace('', pd.NA, inplace=True)
-        cleaned_df = df_sheet.dropna(how='all').dropna(axis=1, how='all').reset_index(drop=True)
+        df_sheet = _sheet_rows_to_frame(data_rows, header)
+        cleaned_df = _drop_blank_rows_and_columns(df_sheet).reset_index(drop=True)
         
         if cleaned_df.empty:
             logger.debug(f"Aba '{title}' sem linhas após limpeza")
@@ -657,9 +840,17 @@ def load_google_ads_sheet(spreadsheet_id, credentials, preferred_sheets=None):
     }
 
 
+def _as_file_like(data) -> io.BytesIO:
+    """Aceita bytes ou buffer já aberto (ex.: download do Drive) e devolve um buffer rebobinado."""
+    if hasattr(data, 'read'):
+        data.seek(0)
+        return data
+    return io.BytesIO(data)
+
+
 def load_leads_dataframe_from_bytes(file_bytes, filename='planilha.xlsx', priority_names=None):
     """Lê planilhas locais combinando todas as abas com dados válidos."""
-    file_like = io.BytesIO(file_bytes)
+    file_like = _as_file_like(file_bytes)
     lower_filename = filename.lower()
     priority_names = [name.strip().lower() for name in (priority_names or []) if name.strip()]
 
@@ -671,16 +862,20 @@ def load_leads_dataframe_from_bytes(file_bytes, filename='planilha.xlsx', priori
         file_like.seek(0)
         df = pd.read_csv(file_like, dtype=str)
         df.replace('', pd.NA, inplace=True)
+        # Performance: contagens a partir de uma única máscara notna, sem materializar cópias via dropna
+        filled = df.notna().to_numpy()
+        nonempty_rows = int(np.count_nonzero(filled.any(axis=1)))
+        nonempty_cols = int(np.count_nonzero(filled.any(axis=0)))
         sheet_stats.append({
             'name': 'CSV',
-            'rows': int(df.dropna(how='all').shape[0]),
-            'columns': int(df.dropna(axis=1, how='all').shape[1])
+            'rows': nonempty_rows,
+            'columns': nonempty_cols
         })
         return df, {
             'primary_sheet': 'CSV',
             'sheet_stats': sheet_stats,
             'sheet_count': 1,
-            'combined_rows': int(df.dropna(how='all').shape[0]),
+            'combined_rows': nonempty_rows,
             'source': 'csv_upload',
             'matched_priority': ['CSV'] if 'csv' in priority_names else [],
             'ordered_sheets': ['CSV']
@@ -688,21 +883,20 @@ def load_leads_dataframe_from_bytes(file_bytes, filename='planilha.xlsx', priori
 
     try:
         file_like.seek(0)
-        # Usa openpyxl que é mais rápido para arquivos .xlsx
         try:
-            sheets_dict = pd.read_excel(file_like, sheet_name=None, dtype=str, engine='openpyxl')
+            sheets_dict = pd.read_excel(file_like, sheet_name=None, dtype=str, engine=EXCEL_ENGINE)
         except:
             # Fallback para engine padrão
             sheets_dict = pd.read_excel(file_like, sheet_name=None, dtype=str)
 
         for sheet_name, sheet_df in sheets_dict.items():
-            cleaned_df = sheet_df.dropna(how='all').dropna(axis=1, how='all')
-            cleaned_df.replace('', pd.NA, inplace=True)
+            # Células '' contam como vazias, para que linhas só com '' também saiam
+            cleaned_df = _drop_blank_rows_and_columns(sheet_df)
             rows = int(cleaned_df.shape[0])
             cols = int(cleaned_df.shape[1])
 
             sheet_stats.append({'name': sheet_name, 'rows': rows, 'columns': cols})
-            print(f"[LEADS] Aba '{sheet_name}' -> linhas: {rows}, colunas: {cols}")
+            logger.debug(f"[LEADS] Aba '{sheet_name}' -> linhas: {rows}, colunas: {cols}")
 
             if rows == 0 or cols == 0:
                 continue
@@ -716,8 +910,9 @@ def load_leads_dataframe_from_bytes(file_bytes, filename='planilha.xlsx', priori
         matched_priority = []
         
         if priority_names:
+            titles_by_lower = _titles_by_lower(frames_map)
             for name in priority_names:
-                match = next((title for title in frames_map.keys() if title.lower() == name.lower()), None)
+                match = titles_by_lower.get(name.lower())
                 if match and match not in ordered_titles:
                     ordered_titles.append(match)
                     matched_priority.append(match)
@@ -726,8 +921,8 @@ def load_leads_dataframe_from_bytes(file_bytes, filename='planilha.xlsx', priori
                 ordered_titles.append(title)
 
         frames = [frames_map[title] for title in ordered_titles]
+        # Performance: cada aba já chega sem linhas vazias; um único concat, sem dropna/reset_index depois
         combined_df = pd.concat(frames, ignore_index=True, sort=False)
-        combined_df = combined_df.dropna(how='all').reset_index(drop=True)
         combined_rows = int(combined_df.shape[0])
 
         primary_sheet = matched_priority[0] if matched_priority else ordered_titles[0]
@@ -742,11 +937,10 @@ def load_leads_dataframe_from_bytes(file_bytes, filename='planilha.xlsx', priori
             'ordered_sheets': ordered_titles
         }
     except Exception as exc:
-        print(f"[LEADS] Falha ao combinar abas ({exc}), tentando leitura simples.")
+        logger.warning(f"[LEADS] Falha ao combinar abas ({exc}), tentando leitura simples.")
         file_like.seek(0)
         df = pd.read_excel(file_like, dtype=str)
-        df.replace('', pd.NA, inplace=True)
-        df = df.dropna(how='all').dropna(axis=1, how='all').reset_index(drop=True)
+        df = _drop_blank_rows_and_columns(df).reset_index(drop=True)
         sheet_stats.append({'name': 'Sheet1', 'rows': int(df.shape[0]), 'columns': int(df.shape[1])})
         return df, {
             'primary_sheet': 'Sheet1',
@@ -759,13 +953,27 @@ def load_leads_dataframe_from_bytes(file_bytes, filename='planilha.xlsx', priori
         }
 
 def load_drive_credentials():
+    """
+    Carrega credenciais do Google Drive (em cache após o primeiro sucesso).
+    
+    Performance: Evita reler e reparsear o JSON da service account a cada requisição.
+    """
+    credentials = _load_drive_credentials_cached()
+    if credentials is None:
+        # Falhas não ficam em cache: a próxima chamada tenta de novo
+        _load_drive_credentials_cached.cache_clear()
+    return credentials
+
+
+@lru_cache(maxsize=1)
+def _load_drive_credentials_cached():
     """Carrega credenciais do Google Drive - suporta arquivo ou variável de ambiente"""
     try:
         # Método 1: Tentar carregar de variável de ambiente (para Vercel/cloud)
         credentials_json = os.getenv('GOOGLE_CREDENTIALS_JSON')
         if credentials_json:
             try:
-                print(f"[DEBUG] GOOGLE_CREDENTIALS_JSON encontrada (tamanho: {len(credentials_json)} chars)")
+                logger.debug(f"GOOGLE_CREDENTIALS_JSON encontrada (tamanho: {len(credentials_json)} chars)")
                 # Limpa o JSON (remove espaços extras no início/fim)
                 credentials_json = credentials_json.strip()
                 
@@ -777,10 +985,10 @@ def load_drive_credentials():
                 required_fields = ['type', 'project_id', 'private_key', 'client_email']
                 missing_fields = [field for field in required_fields if field not in credentials_info]
                 if missing_fields:
-                    print(f"[ERROR] Campos obrigatórios faltando: {missing_fields}")
+                    logger.error(f"Campos obrigatórios faltando: {missing_fields}")
                     raise ValueError(f"Campos obrigatórios faltando: {missing_fields}")
                 
-                print(f"[DEBUG] JSON parseado com sucesso. Type: {credentials_info.get('type')}, Email: {credentials_info.get('client_email')}")
+                logger.debug(f"JSON parseado com sucesso. Type: {credentials_info.get('type')}, Email: {credentials_info.get('client_email')}")
                 
                 credentials = service_account.Credentials.from_service_account_info(
                     credentials_info,
@@ -789,20 +997,16 @@ def load_drive_credentials():
                         'https://www.googleapis.com/auth/spreadsheets.readonly'
                     ]
                 )
-                print("[SUCCESS] Credenciais carregadas de variável de ambiente GOOGLE_CREDENTIALS_JSON")
+                logger.info("Credenciais carregadas de variável de ambiente GOOGLE_CREDENTIALS_JSON")
                 return credentials
             except json_lib.JSONDecodeError as json_error:
-                print(f"[ERROR] Erro ao fazer parse do JSON: {json_error}")
-                print(f"[DEBUG] Primeiros 200 chars do JSON: {credentials_json[:200]}")
-                import traceback
-                traceback.print_exc()
+                logger.error(f"Erro ao fazer parse do JSON: {json_error}", exc_info=True)
+                logger.debug(f"Primeiros 200 chars do JSON: {credentials_json[:200]}")
             except Exception as env_error:
-                print(f"[ERROR] Erro ao carregar credenciais da variável de ambiente: {env_error}")
-                import traceback
-                traceback.print_exc()
+                logger.error(f"Erro ao carregar credenciais da variável de ambiente: {env_error}", exc_info=True)
                 # Continua para tentar método 2
         else:
-            print("[DEBUG] GOOGLE_CREDENTIALS_JSON não encontrada, tentando arquivo...")
+            logger.debug("GOOGLE_CREDENTIALS_JSON não encontrada, tentando arquivo...")
         
         # Método 2: Tentar carregar de arquivo (para desenvolvimento local)
         credentials_file = os.getenv('GOOGLE_APPLICATION_CREDENTIALS')
@@ -813,7 +1017,7 @@ def load_drive_credentials():
         
         # Verifica se o arquivo existe
         if os.path.exists(credentials_file):
-            print(f"[DEBUG] Tentando carregar credenciais de arquivo: {credentials_file}")
+            logger.debug(f"Tentando carregar credenciais de arquivo: {credentials_file}")
             credentials = service_account.Credentials.from_service_account_file(
                 credentials_file,
                 scopes=[
@@ -821,24 +1025,22 @@ def load_drive_credentials():
                     'https://www.googleapis.com/auth/spreadsheets.readonly'
                 ]
             )
-            print(f"[SUCCESS] Credenciais carregadas de arquivo: {credentials_file}")
+            logger.info(f"Credenciais carregadas de arquivo: {credentials_file}")
             return credentials
         else:
-            print(f"[ERROR] Arquivo de credenciais não encontrado: {credentials_file}")
-            print(f"[DEBUG] Diretório atual: {os.getcwd()}")
+            logger.error(f"Arquivo de credenciais não encontrado: {credentials_file}")
+            logger.debug(f"Diretório atual: {os.getcwd()}")
             # Não lista diretório no Vercel para evitar erro
             if os.path.exists('.'):
                 try:
                     files = [f for f in os.listdir('.') if f.endswith('.json')]
-                    print(f"[DEBUG] Arquivos JSON encontrados: {files}")
+                    logger.debug(f"Arquivos JSON encontrados: {files}")
                 except Exception as list_error:
-                    print(f"[DEBUG] Erro ao listar arquivos: {list_error}")
+                    logger.debug(f"Erro ao listar arquivos: {list_error}")
             return None
             
     except Exception as e:
-        print(f"Erro ao carregar credenciais: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"Erro ao carregar credenciais: {e}", exc_info=True)
         return None
 
 # Performance: Retry logic para Google Drive
@@ -868,7 +1070,9 @@ def _download_file_from_drive_with_retry(service, file_id):
         logger.debug("Arquivo binário detectado, baixando diretamente...")
         request = service.files().get_media(fileId=file_id)
     
-    file_content = io.BytesIO()
+    # Performance: até DRIVE_SPOOL_MAX_BYTES o download fica em memória; acima disso
+    # o SpooledTemporaryFile passa para disco e não segura o arquivo inteiro no heap
+    file_content = tempfile.SpooledTemporaryFile(max_size=DRIVE_SPOOL_MAX_BYTES, mode='w+b')
     downloader = MediaIoBaseDownload(file_content, request)
     
     done = False
@@ -877,9 +1081,15 @@ def _download_file_from_drive_with_retry(service, file_id):
         if status:
             logger.debug(f"Progresso: {int(status.progress() * 100)}%")
     
+    # Performance: devolve o próprio buffer (rebobinado) em vez de copiar com getvalue()
     file_content.seek(0)
     logger.debug(f"Download concluído: {file_name}")
-    return file_content.getvalue(), file_name
+    return file_content, file_name
+
+
+def _drive_service(credentials):
+    """Cliente da Drive API da thread atual, reaproveitado entre requisições."""
+    return _thread_google_client('drive', 'v3', credentials)
 
 
 def download_file_from_drive(file_id, credentials):
@@ -889,7 +1099,7 @@ def download_file_from_drive(file_id, credentials):
     Performance: Usa retry logic para melhorar confiabilidade.
     """
     try:
-        service = build('drive', 'v3', credentials=credentials)
+        service = _drive_service(credentials)
         
         # Performance: Retry automático para download
         file_content, file_name = _download_file_from_drive_with_retry(service, file_id)
@@ -898,13 +1108,53 @@ def download_file_from_drive(file_id, credentials):
         logger.error(f"Erro ao baixar arquivo: {e}", exc_info=True)
         return None, None
 
+
+# fileId -> (momento da consulta, modifiedTime)
+_DRIVE_MODIFIED_TIMES: Dict[str, Tuple[datetime, str]] = {}
+
+
+def _drive_file_modified_time(file_id: str, credentials) -> Optional[str]:
+    """
+    Consulta apenas o modifiedTime do arquivo no Drive (chamada de metadados leve).
+    
+    Performance: o valor fica memorizado por DRIVE_MODIFIED_TIME_TTL_SECONDS, então
+    requisições próximas (inclusive cache hits) não pagam a ida ao Drive.
+    """
+    now = datetime.now()
+    memo = _DRIVE_MODIFIED_TIMES.get(file_id)
+    if memo and (now - memo[0]).total_seconds() <= DRIVE_MODIFIED_TIME_TTL_SECONDS:
+        return memo[1]
+    try:
+        service = _drive_service(credentials)
+        modified_time = service.files().get(fileId=file_id, fields='modifiedTime').execute().get('modifiedTime')
+    except Exception as e:
+        logger.warning("Não foi possível obter modifiedTime do arquivo %s: %s", file_id, e)
+        return None
+    if modified_time:
+        _DRIVE_MODIFIED_TIMES[file_id] = (now, modified_time)
+    return modified_time
+
+
+def drive_cache_key(route: str, file_id: str, credentials) -> Optional[str]:
+    """
+    Chave de cache da resposta de uma rota automática: (rota, fileId, modifiedTime).
+    
+    Performance: enquanto o arquivo não mudar no Drive, a rota devolve a análise
+    em cache sem baixar e reler a planilha. Sem modifiedTime, não há cache.
+    """
+    modified_time = _drive_file_modified_time(file_id, credentials)
+    if not modified_time:
+        logger.warning("Sem modifiedTime do arquivo %s: resposta de /%s não será cacheada", file_id, route)
+        return None
+    return f"drive:{route}:{file_id}:{modified_time}"
+
 def clean_dataframe_for_json(df: pd.DataFrame, max_rows: int = 2000) -> list:
     """
     Converte DataFrame para formato JSON otimizado.
     
     Clean Code Principles:
     - Single Responsibility: Apenas converte DataFrame para JSON
-    - Performance: Usa operações vetorizadas ao invés de iterrows()
+    - Performance: Processa coluna a coluna e monta os registros uma única vez
     
     Args:
         df: DataFrame a ser convertido
@@ -917,66 +1167,53 @@ def clean_dataframe_for_json(df: pd.DataFrame, max_rows: int = 2000) -> list:
         df = df.head(max_rows)
     
     try:
-        df_cleaned = _normalize_dataframe_types(df)
-        df_cleaned = _fill_numeric_nulls(df_cleaned)
-        df_cleaned = _convert_datetime_columns(df_cleaned)
-        
-        return df_cleaned.to_dict('records')
+        columns = list(df.columns)
+        # Performance: iloc evita ambiguidade com nomes de coluna duplicados
+        col_lists = [_column_to_json_list(df.iloc[:, i], col) for i, col in enumerate(columns)]
+        return [dict(zip(columns, row)) for row in zip(*col_lists)]
     except Exception as e:
         logger.warning(f"Erro na conversão otimizada, usando fallback: {e}")
         return _fallback_dataframe_to_json(df.head(MAX_ROWS_FOR_FALLBACK))
 
 
-def _normalize_dataframe_types(df: pd.DataFrame) -> pd.DataFrame:
-    """Normaliza tipos de dados do DataFrame para serialização JSON."""
-    df_copy = df.copy()
-    
-    for col in df_copy.columns:
-        if df_copy[col].dtype in ['int64', 'int32']:
-            df_copy[col] = df_copy[col].astype('Int64')
-        elif df_copy[col].dtype in ['float64', 'float32']:
-            df_copy[col] = df_copy[col].astype('float64')
-    
-    return df_copy
-
-
-def _fill_numeric_nulls(df: pd.DataFrame) -> pd.DataFrame:
-    """Preenche valores nulos em colunas numéricas com 0."""
-    NUMERIC_KEYWORDS = ['CPL', 'CPMQL', 'CPC', 'CPM', 'CTR', 'LEAD', 'MQL', 
-                        'INVESTIMENTO', 'CLIQUES', 'IMPRESSÕES']
-    
-    numeric_cols = [
-        col for col in df.columns 
-        if any(keyword in str(col).upper() for keyword in NUMERIC_KEYWORDS)
-    ]
+def _column_to_json_list(series: pd.Series, col: Any) -> list:
+    """
+    Converte uma coluna em lista serializável, classificando-a uma única vez.
     
-    for col in numeric_cols:
-        if col in df.columns and df[col].dtype in ['int64', 'float64', 'Int64']:
-            df[col] = df[col].fillna(0.0)
+    - Colunas de métrica numéricas: nulos viram 0.0
+    - Colunas datetime: string 'YYYY-MM-DD'
+    - Demais colunas: nulos viram None (colunas sem nulos saem direto de tolist())
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        series = series.dt.strftime('%Y-%m-%d')
+    elif pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+        if _is_numeric_keyword_column(col):
+            return series.astype('float64').fillna(0.0).tolist()
+        if not series.hasnans:
+            return series.tolist()
     
-    df = df.where(pd.notnull(df), None)
-    return df
+    # Performance: só colunas com nulos passam pela troca NaN -> None
+    missing = series.isna()
+    if not missing.any():
+        return series.tolist()
+    return series.astype(object).where(~missing, None).tolist()
 
 
-def _convert_datetime_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Converte colunas datetime para string."""
-    for col in df.columns:
-        if df[col].dtype == 'datetime64[ns]':
-            df[col] = df[col].dt.strftime('%Y-%m-%d')
-    return df
+def _is_numeric_keyword_column(col: Any) -> bool:
+    """Indica se o nome da coluna corresponde a uma métrica numérica conhecida."""
+    return NUMERIC_COL_RE.search(str(col).upper()) is not None
 
 
 def _fallback_dataframe_to_json(df: pd.DataFrame) -> list:
     """Método fallback limitado para conversão (usado apenas em caso de erro)."""
-    NUMERIC_KEYWORDS = ['CPL', 'CPMQL', 'CPC', 'CPM', 'CTR', 'LEAD', 'MQL', 
-                        'INVESTIMENTO', 'CLIQUES', 'IMPRESSÕES']
-    
     cleaned_data = []
-    for _, row in df.iterrows():
+    columns = list(df.columns)
+    # Performance: itertuples() devolve tuplas simples, sem montar uma Series por linha
+    for row in df.itertuples(index=False, name=None):
         clean_row = {}
-        for col, value in row.items():
+        for col, value in zip(columns, row):
             if pd.isna(value):
-                clean_row[col] = 0.0 if any(kw in col.upper() for kw in NUMERIC_KEYWORDS) else None
+                clean_row[col] = 0.0 if _is_numeric_keyword_column(col) else None
             elif isinstance(value, (int, float)):
                 clean_row[col] = float(value) if not pd.isna(value) else 0.0
             else:
@@ -1000,15 +1237,6 @@ def _normalize_source_column(series: pd.Series) -> pd.Series:
     return normalized.fillna(DEFAULT_SOURCE)
 
 
-def _parse_dates_vectorized(series: pd.Series) -> pd.Series:
-    """
-    Converte datas brasileiras usando operações vetorizadas.
-    
-    Clean Code: Função focada em uma única responsabilidade.
-    Performance: Evita apply() usando pd.to_datetime vetorizado.
-    """
-    return pd.to_datetime(series, dayfirst=True, errors='coerce').dt.strftime('%d/%m/%Y').fillna('')
-
 def analyze_google_ads_funnels(df):
     """Gera métricas financeiras da aba Controle Google ADS 2."""
     result = {
@@ -1069,14 +1297,16 @@ def analyze_google_ads_funnels(df):
     records = []
     total_entry = None
     
-    for _, row in working_df.iterrows():
-        name = str(row.get(name_col, '')).strip()
+    # Performance: itertuples() devolve tuplas simples, sem montar uma Series por linha
+    funnel_rows = working_df[[name_col, clicks_col, impressions_col, cost_col]].itertuples(index=False, name=None)
+    for name_val, clicks_val, impressions_val, cost_val in funnel_rows:
+        name = str(name_val).strip()
         if not name:
             continue
         
-        clicks = float(row.get(clicks_col, 0) or 0)
-        impressions = float(row.get(impressions_col, 0) or 0)
-        investimento = float(row.get(cost_col, 0) or 0)
+        clicks = float(clicks_val or 0)
+        impressions = float(impressions_val or 0)
+        investimento = float(cost_val or 0)
         ctr = (clicks / impressions * 100) if impressions else 0.0
         cpc = (investimento / clicks) if clicks else 0.0
         is_total = normalize_sheet_title(name) in {'total', 'totais', 'geral'}
@@ -1121,6 +1351,20 @@ def analyze_google_ads_funnels(df):
     result['has_data'] = True
     return result
 
+def _is_text_dtype(dtype) -> bool:
+    """dtype object ou o dtype str/string do pandas (colunas str do pandas 3 não são object)."""
+    return dtype == object or isinstance(dtype, pd.StringDtype)
+
+
+def text_columns(df: pd.DataFrame) -> List[Any]:
+    """
+    Colunas de texto: dtype object ou o dtype str/string do pandas.
+    
+    Clean Code: evita select_dtypes(include='object'), que no pandas 3 emite
+    aviso de depreciação para colunas str.
+    """
+    return [col for col, dtype in df.dtypes.items() if _is_text_dtype(dtype)]
+
 def fill_empty_fields_with_zero(df):
     """Preenche campos em branco com 0"""
     # Identifica colunas numéricas
@@ -1130,76 +1374,60 @@ def fill_empty_fields_with_zero(df):
     df[numeric_columns] = df[numeric_columns].fillna(0)
     
     # Para colunas de texto, verifica se contém valores que podem ser convertidos para números
-    text_columns = df.select_dtypes(include=['object']).columns
-    for col in text_columns:
-        # Verifica se a coluna contém principalmente números (ignorando NaN)
-        non_null_values = df[col].dropna()
-        if len(non_null_values) > 0:
-            try:
-                # Tenta converter valores não-nulos para numérico
-                # Usa astype('str') primeiro para garantir que é string, não objeto concatenado
-                numeric_values = pd.to_numeric(non_null_values.astype('str'), errors='coerce')
-                # Se mais de 50% dos valores não-nulos são numéricos, trata como numérica
-                if len(numeric_values.dropna()) / len(non_null_values) > 0.5:
-                    # Converte toda a coluna para numérica e preenche NaN com 0
-                    # Usa apply para converter item por item
-                    try:
-                        # Clean Code: Operação vetorizada ao invés de apply com lambda
-                        df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-                    except:
-                        # Se der erro, mantém como string e preenche com string vazia
-                        df[col] = df[col].fillna('')
-                else:
-                    # Preenche com string vazia
-                    df[col] = df[col].fillna('')
-            except Exception as e:
-                # Se houver erro, preenche com string vazia
-                print(f"Erro ao processar coluna {col}: {e}")
-                df[col] = df[col].fillna('')
-        else:
+    # Performance: uma única conversão vetorizada por coluna, reaproveitada no teste e no preenchimento
+    for col in text_columns(df):
+        total = df[col].notna().sum()
+        if total == 0:
             # Se todos os valores são NaN, preenche com string vazia
             df[col] = df[col].fillna('')
+            continue
+        
+        coerced = pd.to_numeric(df[col], errors='coerce')
+        # Se mais de 50% dos valores não-nulos são numéricos, trata como numérica
+        # (coerced só é não-nulo onde o original também era: dispensa filtrar a Series)
+        if coerced.notna().sum() / total > 0.5:
+            # Performance: colunas só com inteiros viram o menor tipo inteiro possível
+            df[col] = pd.to_numeric(coerced.fillna(0), downcast='integer')
+        else:
+            df[col] = df[col].fillna('')
     
     return df
 
 def fill_lead_mql_columns(df, leads_cols):
     """Preenche especificamente colunas de leads e MQLs com 0"""
-    # Preenche coluna de leads
-    if leads_cols.get('lead'):
-        lead_col = leads_cols['lead']
-        if lead_col in df.columns:
-            # Converte para numérico e preenche NaN com 0
-            df[lead_col] = pd.to_numeric(df[lead_col], errors='coerce').fillna(0)
+    lead_col = leads_cols.get('lead')
+    mql_col = leads_cols.get('mql')
     
-    # Preenche coluna de MQLs
-    if leads_cols.get('mql'):
-        mql_col = leads_cols['mql']
-        if mql_col in df.columns:
+    # Preenche colunas de leads e MQLs
+    # Performance: contagens inteiras são reduzidas ao menor tipo inteiro que as comporta
+    for count_col in (lead_col, mql_col):
+        if count_col and count_col in df.columns:
             # Converte para numérico e preenche NaN com 0
-            df[mql_col] = pd.to_numeric(df[mql_col], errors='coerce').fillna(0)
+            counts = pd.to_numeric(df[count_col], errors='coerce').fillna(0)
+            df[count_col] = pd.to_numeric(counts, downcast='integer')
     
     # Preenche outras colunas que podem ter valores numéricos vazios
     for col in df.columns:
         # Se o nome da coluna sugere que é numérico (CPL, CPMQL, etc.)
         # Mas só converte se não for uma das colunas de leads/mqls já processadas
-        col_upper = col.upper()
-        if (any(keyword in col_upper for keyword in ['CPL', 'CPMQL', 'CPC', 'CPM', 'CTR']) and 
+        if (RATIO_COL_RE.search(str(col).upper()) and
             col != lead_col and col != mql_col):
             # Tenta converter para numérico e preenche NaN com 0
             df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
     
     return df
 
+def find_term_column(df):
+    """Retorna a coluna Term (case insensitive) ou None"""
+    return next((col for col in df.columns if str(col).lower() == 'term'), None)
+
 def fill_term_column(df):
     """Preenche coluna Term vazia com 'organico'"""
-    # Procura pela coluna Term (case insensitive)
-    for col in df.columns:
-        if col.lower() == 'term':
-            df[col] = df[col].fillna('organico')
-            # Também preenche strings vazias
-            df[col] = df[col].replace('', 'organico')
-            print(f"Coluna '{col}' preenchida com 'organico' onde estava vazio")
-            break
+    col = find_term_column(df)
+    if col is not None:
+        # Performance: nulos e strings vazias preenchidos numa única escrita
+        df[col] = df[col].mask(df[col].isna() | (df[col] == ''), 'organico')
+        logger.debug(f"Coluna '{col}' preenchida com 'organico' onde estava vazio")
     return df
 
 def process_mql_column_to_leads(df):
@@ -1212,16 +1440,19 @@ def process_mql_column_to_leads(df):
             break
     
     if mql_col:
-        print(f"Encontrada coluna MQL: {mql_col}")
+        logger.debug("Encontrada coluna MQL: %s", mql_col)
         
         # Cria colunas temporárias de contagem
         # Clean Code: Operações vetorizadas ao invés de apply com lambda
+        # Performance: uint8 basta para flags 0/1 e ocupa 1/8 da memória de int64
         mql_upper = df[mql_col].fillna('').astype(str).str.upper().str.strip()
-        df['COUNT_LEAD'] = (mql_upper == 'LEAD').astype(int)
-        df['COUNT_MQL'] = (mql_upper == 'MQL').astype(int)
+        df['COUNT_LEAD'] = (mql_upper == 'LEAD').astype('uint8')
+        df['COUNT_MQL'] = (mql_upper == 'MQL').astype('uint8')
         
-        print(f"Total de LEADS (contados): {df['COUNT_LEAD'].sum()}")
-        print(f"Total de MQLs (contados): {df['COUNT_MQL'].sum()}")
+        # Performance: as somas de conferência só são calculadas com DEBUG ativo
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Total de LEADS (contados): %d", df['COUNT_LEAD'].sum())
+            logger.debug("Total de MQLs (contados): %d", df['COUNT_MQL'].sum())
         
         return True, 'COUNT_LEAD', 'COUNT_MQL'
     
@@ -1260,78 +1491,142 @@ def parse_brazilian_date(date_str):
     except Exception as e:
         return str(date_str)[:10] if date_str else ""
 
-def detect_date_column(df):
+# Datas ISO (YYYY-MM-DD...), como as células de data do Excel lidas com dtype=str
+ISO_DATE_PREFIX_RE = re.compile(r'^\d{4}-\d{2}-\d{2}')
+
+
+def to_datetime_dayfirst(series: pd.Series, mixed: bool = False) -> pd.Series:
+    """
+    pd.to_datetime com dia primeiro (DD/MM/YYYY), lendo valores ISO como ISO.
+    
+    Com dayfirst=True o pandas troca dia e mês de '2025-03-04' (vira 3 de abril)
+    quando o dia é <= 12; por isso os valores ISO são convertidos à parte com
+    format='ISO8601'. mixed=True aceita formatos diferentes linha a linha.
+    """
+    extra = {'format': 'mixed'} if mixed else {}
+    if not (pd.api.types.is_object_dtype(series.dtype) or pd.api.types.is_string_dtype(series.dtype)):
+        return pd.to_datetime(series, dayfirst=True, errors='coerce', **extra)
+    text = series.astype(str).str.strip()
+    is_iso = series.notna() & text.str.match(ISO_DATE_PREFIX_RE)
+    if not is_iso.any():
+        return pd.to_datetime(series, dayfirst=True, errors='coerce', **extra)
+    parsed = pd.to_datetime(series.where(~is_iso), dayfirst=True, errors='coerce', **extra)
+    iso_parsed = pd.to_datetime(text[is_iso], format='ISO8601', errors='coerce')
+    return parsed.mask(is_iso, iso_parsed.reindex(series.index))
+
+
+def parse_brazilian_date_series(series: pd.Series, parsed: Optional[pd.Series] = None) -> pd.Series:
+    """
+    Versão vetorizada de parse_brazilian_date para uma coluna inteira.
+    
+    Performance: Usa o parser de datas do pandas uma única vez; só o restante
+    não reconhecido passa por um segundo parse e pelo ajuste de texto DD/MM/YYYY.
+    Quem já converteu a coluna com to_datetime_dayfirst passa o resultado em
+    parsed e evita repetir o parse.
+    """
+    if parsed is None:
+        parsed = to_datetime_dayfirst(series)
+    result = parsed.dt.strftime('%d/%m/%Y')
+    
+    pending = parsed.isna() & series.notna()
+    if not pending.any():
+        return result.fillna('')
+    
+    # Formatos mistos na mesma coluna (ex.: '04/03/2025' e '2025-03-04 10:00:00')
+    remainder = series[pending].astype(str).str.strip()
+    reparsed = to_datetime_dayfirst(remainder, mixed=True)
+    result.loc[reparsed.index] = reparsed.dt.strftime('%d/%m/%Y')
+    
+    # Último recurso: completa com zeros datas textuais D/M/YYYY
+    date_part = remainder[reparsed.isna()].str.split(' ', n=1).str[0]
+    date_part = date_part[date_part.str.count('/') == 2]
+    if not date_part.empty:
+        parts = date_part.str.split('/', expand=True)
+        result.loc[parts.index] = parts[0].str.zfill(2) + '/' + parts[1].str.zfill(2) + '/' + parts[2]
+    
+    return result.fillna('')
+
+# Colunas de métricas numéricas que nunca são tratadas como criativo
+CREATIVE_METRIC_COLUMNS = frozenset({
+    'lead', 'leads', 'mql', 'mqls', 'cliques', 'impressoes', 'impressão',
+    'investimento', 'custo', 'cpl', 'cpmql', 'cpc', 'cpm', 'ctr',
+    'conversao', 'conversão', 'taxa', 'alcance', 'reach'
+})
+# Palavras-chave (nomes em minúsculas) usadas na detecção de criativo/campanha
+CREATIVE_NAME_RE = re.compile(r'criativo|creative')
+CAMPAIGN_NAME_RE = re.compile(r'campaign|campanha')
+CONTENT_NAME_RE = re.compile(r'content|conteudo|conteúdo|anuncio|anúncio')
+CREATIVE_HINT_RE = re.compile(r'banner|imagem|video|vídeo|texto|titulo|título|copy|headline')
+DATE_NAME_RE = re.compile(r'data|date|dia')
+DATE_COLUMN_NAMES = frozenset({'data', 'date', 'dia'})
+# Nomes ignorados ao escolher uma coluna de texto qualquer como criativo
+CREATIVE_FALLBACK_STOPWORDS = frozenset({
+    'data', 'date', 'dia', 'leads', 'mql', 'investimento', 'custo',
+    'cpl', 'cpmql', 'cpc', 'cpm', 'ctr'
+})
+
+
+def _column_map(df: pd.DataFrame) -> List[Tuple[Any, str]]:
+    """
+    Lista de pares (coluna, nome normalizado em minúsculas).
+    
+    Performance: Calculada uma vez e compartilhada entre os detectores.
+    """
+    return [(col, str(col).lower().strip()) for col in df.columns]
+
+
+def detect_date_column(df, columns=None):
     """Detecta automaticamente a coluna de data"""
-    for col in df.columns:
-        col_lower = str(col).lower()
-        if any(keyword in col_lower for keyword in ['data', 'date', 'dia']):
+    for col, col_lower in columns or _column_map(df):
+        if DATE_NAME_RE.search(col_lower):
             return col
     return None
 
-def detect_creative_columns(df):
+def detect_creative_columns(df, columns=None):
     """Detecta automaticamente as colunas de criativo"""
     detected = {
         'campaign': None,
         'creative': None
     }
     
-    # Lista de colunas que devem ser ignoradas (métricas numéricas)
-    metrics_keywords = ['lead', 'leads', 'mql', 'mqls', 'cliques', 'impressoes', 'impressão', 
-                       'investimento', 'custo', 'cpl', 'cpmql', 'cpc', 'cpm', 'ctr', 
-                       'conversao', 'conversão', 'taxa', 'alcance', 'reach']
+    # Pular colunas que são métricas numéricas
+    candidates = [
+        (col, col_lower) for col, col_lower in columns or _column_map(df)
+        if col_lower not in CREATIVE_METRIC_COLUMNS
+    ]
     
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        
-        # Pular colunas que são métricas numéricas
-        if col_lower in metrics_keywords or any(keyword == col_lower for keyword in metrics_keywords):
-            continue
-            
+    for col, col_lower in candidates:
         # Priorizar colunas que contenham "criativo" ou "creative"
-        if any(keyword in col_lower for keyword in ['criativo', 'creative']):
+        if CREATIVE_NAME_RE.search(col_lower):
             detected['creative'] = col
-        elif any(keyword in col_lower for keyword in ['campaign', 'campanha']):
+        elif CAMPAIGN_NAME_RE.search(col_lower):
             detected['campaign'] = col
-        elif any(keyword in col_lower for keyword in ['content', 'conteudo', 'conteúdo', 'anuncio', 'anúncio']):
+        elif CONTENT_NAME_RE.search(col_lower):
             detected['creative'] = col
     
     # Se não encontrar nenhuma, tentar outras colunas que podem ser criativos
     if not detected['creative'] and not detected['campaign']:
-        for col in df.columns:
-            col_lower = str(col).lower().strip()
-            
-            # Pular métricas
-            if col_lower in metrics_keywords or any(keyword == col_lower for keyword in metrics_keywords):
-                continue
-                
+        for col, col_lower in candidates:
             # Procurar por outras palavras-chave que podem indicar criativos
-            if any(keyword in col_lower for keyword in ['banner', 'imagem', 'video', 'vídeo', 'texto', 'titulo', 'título', 'copy', 'headline']):
+            if CREATIVE_HINT_RE.search(col_lower):
                 detected['creative'] = col
                 break
     
     # Se ainda não encontrar, usar a primeira coluna de texto que não seja data nem métrica
     if not detected['creative'] and not detected['campaign']:
-        for col in df.columns:
-            col_lower = str(col).lower().strip()
-            
-            # Pular datas e métricas
-            if col_lower in ['data', 'date', 'dia']:
-                continue
-            if col_lower in metrics_keywords or any(keyword == col_lower for keyword in metrics_keywords):
-                continue
-            
-            # Usar primeira coluna de texto
-            if df[col].dtype == 'object':
-                detected['creative'] = col
-                break
+        # Usar primeira coluna de texto, pulando datas
+        detected['creative'] = next(
+            (col for col, col_lower in candidates
+             if col_lower not in DATE_COLUMN_NAMES and _is_text_dtype(df[col].dtype)),
+            None
+        )
     
     return detected
 
-def detect_cost_columns(df):
+def detect_cost_columns(df, columns=None):
     """Detecta colunas de custo"""
     cost_cols = {}
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
+    for col, col_lower in columns or _column_map(df):
         if col_lower == 'cpl':
             cost_cols['lead'] = col
         elif col_lower == 'cpmql':
@@ -1343,93 +1638,82 @@ def detect_cost_columns(df):
                 cost_cols['total'] = col
     return cost_cols
 
-def detect_leads_columns(df):
+def detect_leads_columns(df, columns=None):
     """Detecta colunas de leads e MQLs"""
+    columns = columns or _column_map(df)
     leads_cols = {}
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
+    for col, col_lower in columns:
         if col_lower == 'lead' or col_lower == 'leads':
             leads_cols['lead'] = col
         elif col_lower == 'mql' or col_lower == 'mqls':
             leads_cols['mql'] = col
     
     if not leads_cols.get('lead'):
-        for col in df.columns:
-            col_lower = str(col).lower().strip()
+        for col, col_lower in columns:
             if 'lead' in col_lower and 'cpl' not in col_lower:
                 leads_cols['lead'] = col
                 break
     
     if not leads_cols.get('mql'):
-        for col in df.columns:
-            col_lower = str(col).lower().strip()
+        for col, col_lower in columns:
             if 'mql' in col_lower and 'cpmql' not in col_lower and 'custo' not in col_lower:
                 leads_cols['mql'] = col
                 break
     
     return leads_cols
 
-def detect_lead_date_column(df):
-    """Detecta coluna de data em planilhas de leads"""
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(keyword in col_lower for keyword in ['data', 'date', 'criado', 'cadastro', 'entrada', 'created']):
+# Performance: palavras-chave das colunas de leads compiladas uma única vez
+LEAD_DATE_RE = re.compile(r'data|date|criado|cadastro|entrada|created')
+LEAD_STATUS_RE = re.compile(r'status|etapa|stage|situação|situacao|fase|pipeline|andamento|mql')
+LEAD_SOURCE_RE = re.compile(r'origem|source|fonte|canal|utm|campanha|midia|mídia|procedência')
+LEAD_OWNER_RE = re.compile(r'respons|consultor|vendedor|owner|account|atendente|agente|seller|executivo')
+LEAD_NAME_RE = re.compile(r'nome|name|lead|contato|cliente')
+LEAD_EMAIL_RE = re.compile(r'email|e-mail|mail')
+LEAD_PHONE_RE = re.compile(r'fone|telefone|phone|celular|whats|whatsapp|tel')
+
+# Status que indicam lead ganho/perdido (busca por substring, sem diferenciar maiúsculas)
+LEAD_WON_KEYWORDS = ('ganho', 'won', 'fechado', 'concluído', 'concluido', 'cliente', 'converted')
+LEAD_LOST_KEYWORDS = ('perdido', 'lost', 'cancelado', 'desistiu', 'no show', 'no-show', 'falhou')
+LEAD_WON_RE = re.compile('|'.join(map(re.escape, LEAD_WON_KEYWORDS)), re.IGNORECASE)
+LEAD_LOST_RE = re.compile('|'.join(map(re.escape, LEAD_LOST_KEYWORDS)), re.IGNORECASE)
+
+def _first_matching_column(df, pattern, columns=None):
+    """Primeira coluna cujo nome normalizado casa com o padrão."""
+    for col, col_lower in columns or _column_map(df):
+        if pattern.search(col_lower):
             return col
     return None
 
-def detect_lead_status_column(df):
+def detect_lead_date_column(df, columns=None):
+    """Detecta coluna de data em planilhas de leads"""
+    return _first_matching_column(df, LEAD_DATE_RE, columns)
+
+def detect_lead_status_column(df, columns=None):
     """Detecta coluna de status em planilhas de leads"""
-    status_keywords = ['status', 'etapa', 'stage', 'situação', 'situacao', 'fase', 'pipeline', 'andamento', 'mql']
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(keyword in col_lower for keyword in status_keywords):
-            return col
-    return None
+    return _first_matching_column(df, LEAD_STATUS_RE, columns)
 
-def detect_lead_source_column(df):
+def detect_lead_source_column(df, columns=None):
     """Detecta coluna de origem em planilhas de leads"""
-    source_keywords = ['origem', 'source', 'fonte', 'canal', 'utm', 'campanha', 'midia', 'mídia', 'procedência']
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(keyword in col_lower for keyword in source_keywords):
-            return col
-    return None
+    return _first_matching_column(df, LEAD_SOURCE_RE, columns)
 
-def detect_lead_owner_column(df):
+def detect_lead_owner_column(df, columns=None):
     """Detecta coluna de responsável em planilhas de leads"""
-    owner_keywords = ['respons', 'consultor', 'vendedor', 'owner', 'account', 'atendente', 'agente', 'seller', 'executivo']
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(keyword in col_lower for keyword in owner_keywords):
-            return col
-    return None
+    return _first_matching_column(df, LEAD_OWNER_RE, columns)
 
-def detect_lead_name_column(df):
+def detect_lead_name_column(df, columns=None):
     """Detecta coluna de nome do lead"""
-    name_keywords = ['nome', 'name', 'lead', 'contato', 'cliente']
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(keyword in col_lower for keyword in name_keywords):
-            return col
+    name_col = _first_matching_column(df, LEAD_NAME_RE, columns)
+    if name_col is not None:
+        return name_col
     return df.columns[0] if len(df.columns) > 0 else None
 
-def detect_lead_email_column(df):
+def detect_lead_email_column(df, columns=None):
     """Detecta coluna de e-mail"""
-    email_keywords = ['email', 'e-mail', 'mail']
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(keyword in col_lower for keyword in email_keywords):
-            return col
-    return None
+    return _first_matching_column(df, LEAD_EMAIL_RE, columns)
 
-def detect_lead_phone_column(df):
+def detect_lead_phone_column(df, columns=None):
     """Detecta coluna de telefone"""
-    phone_keywords = ['fone', 'telefone', 'phone', 'celular', 'whats', 'whatsapp', 'tel']
-    for col in df.columns:
-        col_lower = str(col).lower().strip()
-        if any(keyword in col_lower for keyword in phone_keywords):
-            return col
-    return None
+    return _first_matching_column(df, LEAD_PHONE_RE, columns)
 
 STATUS_LABELS = {
     'aberto': 'Em andamento',
@@ -1846,7 +2130,7 @@ def crosscheck_leads_with_sults(df, name_col, status_col, email_col, phone_col,
     if not process_all:
         # Processa amostra representativa
         df_sample = df.sample(n=max_rows_to_process, random_state=42)
-        print(f"Processando amostra de {max_rows_to_process} leads de {total_rows} total")
+        logger.debug(f"Processando amostra de {max_rows_to_process} leads de {total_rows} total")
     else:
         df_sample = df
     
@@ -2149,31 +2433,50 @@ def crosscheck_leads_with_sults(df, name_col, status_col, email_col, phone_col,
         'source': 'SULTS API'
     }
 
+def _value_counts_by_code(series: pd.Series) -> Tuple[pd.Index, np.ndarray]:
+    """
+    Valores distintos (na ordem em que aparecem) e quantas vezes cada um ocorre.
+    
+    Performance: a coluna é codificada uma única vez (factorize) e contada com
+    bincount; testes por valor (ex.: regex de status) rodam só sobre os distintos.
+    """
+    codes, uniques = pd.factorize(series)
+    return uniques, np.bincount(codes[codes >= 0], minlength=len(uniques))
+
+
+def _month_key_label(month_key: int) -> str:
+    """Formata a chave de mês (ano * 12 + mês - 1) como 'MM/AAAA'."""
+    year, month_index = divmod(month_key, 12)
+    return f"{month_index + 1:02d}/{year}"
+
+
 def analyze_leads_dataframe(df):
     """Gera análises a partir de uma planilha de leads - OTIMIZADO"""
     # Clean Code: Usa constante ao invés de magic number
     if len(df) > MAX_ROWS_FOR_PROCESSING:
-        print(f"Limitando processamento a {MAX_ROWS_FOR_PROCESSING} linhas de {len(df)} total")
+        logger.debug(f"Limitando processamento a {MAX_ROWS_FOR_PROCESSING} linhas de {len(df)} total")
         df = df.head(MAX_ROWS_FOR_PROCESSING)
     
     df = df.copy()
     df.columns = [str(col).strip() for col in df.columns]
     
-    date_col = detect_lead_date_column(df)
-    status_col = detect_lead_status_column(df)
-    source_col = detect_lead_source_column(df)
-    owner_col = detect_lead_owner_column(df)
-    name_col = detect_lead_name_column(df)
-    email_col = detect_lead_email_column(df)
-    phone_col = detect_lead_phone_column(df)
+    # Performance: nomes normalizados uma única vez para todos os detectores
+    columns = _column_map(df)
+    date_col = detect_lead_date_column(df, columns)
+    status_col = detect_lead_status_column(df, columns)
+    source_col = detect_lead_source_column(df, columns)
+    owner_col = detect_lead_owner_column(df, columns)
+    name_col = detect_lead_name_column(df, columns)
+    email_col = detect_lead_email_column(df, columns)
+    phone_col = detect_lead_phone_column(df, columns)
     
     if source_col:
         df[source_col] = _normalize_source_column(df[source_col])
 
     if date_col:
-        df['_lead_date_dt'] = pd.to_datetime(df[date_col], dayfirst=True, errors='coerce')
+        df['_lead_date_dt'] = to_datetime_dayfirst(df[date_col])
         if 'Data_Lead' not in df.columns:
-            df['Data_Lead'] = _parse_dates_vectorized(df[date_col])
+            df['Data_Lead'] = parse_brazilian_date_series(df[date_col], parsed=df['_lead_date_dt'])
     else:
         df['_lead_date_dt'] = pd.NaT
     
@@ -2183,6 +2486,7 @@ def analyze_leads_dataframe(df):
     leads_without_date = total_leads
     monthly_trend = []
     timeline = []
+    temporal_comparison = None
     
     if date_col:
         now = datetime.now()
@@ -2192,22 +2496,29 @@ def analyze_leads_dataframe(df):
         leads_without_date = int(df['_lead_date_dt'].isna().sum())
         
         if not valid_dates.empty:
-            monthly_counts = df.loc[df['_lead_date_dt'].notna(), '_lead_date_dt'].dt.to_period('M').value_counts().sort_index()
+            # Performance: mês como inteiro (ano * 12 + mês - 1) contado com bincount,
+            # sem criar objetos Period; só os meses com leads viram rótulo
+            month_keys = (valid_dates.dt.year * 12 + valid_dates.dt.month - 1).to_numpy(dtype=np.int64)
+            first_key = int(month_keys.min())
+            monthly_counts = np.bincount(month_keys - first_key)
             timeline = [
                 {
-                    'period': period.strftime('%m/%Y'),
-                    'leads': int(count)
+                    'period': _month_key_label(first_key + int(offset)),
+                    'leads': int(monthly_counts[offset])
                 }
-                for period, count in monthly_counts.items()
+                for offset in np.flatnonzero(monthly_counts)
             ]
             
+            def leads_in_month(month_key: int) -> int:
+                offset = month_key - first_key
+                return int(monthly_counts[offset]) if 0 <= offset < len(monthly_counts) else 0
+            
             # Comparação temporal: mês atual vs mês anterior
-            # Performance: Usa pd.Period ao invés de datetime.to_period() (não existe)
-            current_month = pd.Period(datetime.now(), freq='M')
+            current_month = now.year * 12 + now.month - 1
             previous_month = current_month - 1
             
-            current_month_leads = monthly_counts.get(current_month, 0)
-            previous_month_leads = monthly_counts.get(previous_month, 0)
+            current_month_leads = leads_in_month(current_month)
+            previous_month_leads = leads_in_month(previous_month)
             
             # Calcula variação percentual
             if previous_month_leads > 0:
@@ -2215,18 +2526,18 @@ def analyze_leads_dataframe(df):
             else:
                 growth_rate = 100.0 if current_month_leads > 0 else 0.0
             
-            # Adiciona comparação temporal aos KPIs
-            kpis['temporal_comparison'] = {
+            # Adicionada aos KPIs depois que o dicionário é montado
+            temporal_comparison = {
                 'current_month': {
-                    'period': current_month.strftime('%m/%Y'),
-                    'leads': int(current_month_leads)
+                    'period': _month_key_label(current_month),
+                    'leads': current_month_leads
                 },
                 'previous_month': {
-                    'period': previous_month.strftime('%m/%Y'),
-                    'leads': int(previous_month_leads)
+                    'period': _month_key_label(previous_month),
+                    'leads': previous_month_leads
                 },
                 'growth_rate': round(growth_rate, 2),
-                'growth_absolute': int(current_month_leads - previous_month_leads)
+                'growth_absolute': current_month_leads - previous_month_leads
             }
     
     status_distribution = []
@@ -2253,23 +2564,23 @@ def analyze_leads_dataframe(df):
     
     if status_col:
         status_series = df[status_col].fillna('Sem Status').astype(str).str.strip()
-        status_counts = status_series.value_counts().head(15)
+        status_values, status_value_counts = _value_counts_by_code(status_series)
+        # Performance: nlargest seleciona o top 15 sem ordenar todos os valores distintos
+        status_counts = pd.Series(status_value_counts, index=status_values).nlargest(15)
         status_distribution = [
             {'label': status, 'value': int(count)}
             for status, count in status_counts.items()
         ]
         
-        # Otimização: usa operações vetorizadas ao invés de apply
-        status_lower = status_series.str.lower()
-        won_keywords = ['ganho', 'won', 'fechado', 'concluído', 'concluido', 'cliente', 'converted']
-        lost_keywords = ['perdido', 'lost', 'cancelado', 'desistiu', 'no show', 'no-show', 'falhou']
-        
-        # Cria máscaras booleanas de uma vez
-        won_mask = status_lower.str.contains('|'.join(won_keywords), case=False, na=False)
-        lost_mask = status_lower.str.contains('|'.join(lost_keywords), case=False, na=False)
+        # Performance: as regex (pré-compiladas, IGNORECASE) rodam uma vez por status
+        # distinto; cada status recebe um estado (0 = outro, 1 = ganho, 2 = perdido,
+        # 3 = ambos) e um único bincount ponderado soma as linhas de cada estado
+        status_state = (status_values.str.contains(LEAD_WON_RE, na=False).astype(np.intp)
+                        + 2 * status_values.str.contains(LEAD_LOST_RE, na=False).astype(np.intp))
+        state_totals = np.bincount(status_state, weights=status_value_counts, minlength=4)
         
-        leads_won = int(won_mask.sum())
-        leads_lost = int(lost_mask.sum())
+        leads_won = int(state_totals[1] + state_totals[3])
+        leads_lost = int(state_totals[2] + state_totals[3])
         conversion_rate = round((leads_won / total_leads) * 100, 2) if total_leads > 0 else 0.0
 
     if source_col:
@@ -2278,7 +2589,8 @@ def analyze_leads_dataframe(df):
         # Remove JSON-like strings e normaliza
         source_series = source_series.str.replace(r'^\{.*\}$', 'SULTS', regex=True)
         source_series = source_series.replace('', 'SULTS')
-        source_counts = source_series.value_counts().head(15)
+        source_values, source_value_counts = _value_counts_by_code(source_series)
+        source_counts = pd.Series(source_value_counts, index=source_values).nlargest(15)
         source_distribution = [
             {'label': origem, 'value': int(count)}
             for origem, count in source_counts.items()
@@ -2290,7 +2602,8 @@ def analyze_leads_dataframe(df):
         # Remove JSON-like strings e normaliza
         owner_series = owner_series.str.replace(r'^\{.*\}$', 'Sem Responsável', regex=True)
         owner_series = owner_series.replace('', 'Sem Responsável').str.title()
-        owner_counts = owner_series.value_counts().head(15)
+        owner_values, owner_value_counts = _value_counts_by_code(owner_series)
+        owner_counts = pd.Series(owner_value_counts, index=owner_values).nlargest(15)
         owner_distribution = [
             {'label': owner, 'value': int(count)}
             for owner, count in owner_counts.items()
@@ -2354,6 +2667,8 @@ def analyze_leads_dataframe(df):
         'tag_leads': tag_leads,
         'tag_mqls': tag_mqls
     }
+    if temporal_comparison:
+        kpis['temporal_comparison'] = temporal_comparison
     
     distributions = {
         'status': status_distribution,
@@ -2423,7 +2738,10 @@ def analyze_leads_dataframe(df):
     
     df = df.drop(columns=['_lead_date_dt'])
     if source_col:
-        df[source_col] = df[source_col].replace(r'^\s*$', 'organico', regex=True).fillna('organico')
+        # Performance: máscara de vazios (nulo ou só espaços) via str.strip, sem regex por célula
+        source_values = df[source_col]
+        blank_source = source_values.isna() | (source_values.astype(str).str.strip() == '')
+        df[source_col] = source_values.mask(blank_source, 'organico')
 
     source_total = sum(item['value'] for item in source_distribution)
     owner_summary, owner_total = summarize_distribution(owner_distribution)
@@ -2491,70 +2809,256 @@ def debug_credentials():
 def index():
     return render_template('index.html')
 
-@app.route('/upload', methods=['POST'])
-@limiter.limit("10 per minute")
-@handle_errors
-def upload_file():
-    """Endpoint para upload de arquivo com validação e tratamento de erros."""
-    logger.info("Upload request received")
+def _read_spreadsheet(file_like: io.BytesIO, is_csv: bool, **kwargs) -> pd.DataFrame:
+    """Lê CSV ou Excel (EXCEL_ENGINE com fallback para a engine padrão)."""
+    if is_csv:
+        return pd.read_csv(file_like, low_memory=False, engine='c', **kwargs)
+    try:
+        return pd.read_excel(file_like, engine=EXCEL_ENGINE, **kwargs)
+    except Exception as excel_error:
+        logger.warning(f"Erro com {EXCEL_ENGINE}, tentando engine padrão: {excel_error}")
+        file_like.seek(0)
+        return pd.read_excel(file_like, **kwargs)
+
+
+def read_analysis_dataframe(file_bytes: Any, is_csv: bool = False, dtype: Any = None) -> pd.DataFrame:
+    """
+    Lê a planilha de criativos inteira, numa única leitura.
     
-    # Validação de arquivo
-    if 'file' not in request.files:
-        logger.warning("Upload sem arquivo")
-        return jsonify({'error': 'Nenhum arquivo enviado'}), 400
+    Todas as colunas são mantidas: a tabela de dados brutos e a exportação CSV do
+    painel exibem cada coluna de 'raw_data', não só as usadas pela análise.
+    """
+    return _read_spreadsheet(_as_file_like(file_bytes), is_csv, dtype=dtype)
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    """Divisão elemento a elemento arredondada a 2 casas, com 0 onde o denominador é 0."""
+    result = np.divide(numerator, denominator, out=np.zeros_like(numerator, dtype=float), where=denominator != 0)
+    return np.round(result, 2)
+
+
+def _sum_or_count(series: pd.Series, numeric: np.ndarray) -> int:
+    """
+    Soma a versão numérica da coluna; se a soma for zero (coluna sem números),
+    conta as células preenchidas da coluna original.
+    """
+    total = numeric.sum()
+    return int(total) if pd.notna(total) and total != 0 else int(series.notna().sum())
+
+
+def _numeric_values(series: pd.Series) -> np.ndarray:
+    """
+    Converte a coluna para um array float (não numéricos e vazios viram 0).
     
-    file = request.files['file']
-    is_valid, error_msg = validate_file_upload(file)
-    if not is_valid:
-        logger.warning(f"Upload inválido: {error_msg}")
-        return jsonify({'error': error_msg}), 400
+    Performance: colunas já numéricas (ex.: após fill_empty_fields_with_zero) não
+    passam por to_numeric, e o preenchimento com 0 só roda se houver vazios.
+    """
+    if not pd.api.types.is_numeric_dtype(series.dtype):
+        series = pd.to_numeric(series, errors='coerce')
+    values = series.to_numpy(dtype=float, na_value=np.nan)
+    missing = np.isnan(values)
+    return np.where(missing, 0.0, values) if missing.any() else values
+
+
+def _grouped_sum(group_codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Soma values por código de grupo ignorando NaN, como o sum() do groupby."""
+    return np.bincount(group_codes, weights=np.where(np.isnan(values), 0.0, values), minlength=n_groups)
+
+
+def build_creative_stats(df: pd.DataFrame, creative_col: str, lead_values: np.ndarray,
+                         mql_values: Optional[np.ndarray] = None,
+                         cost_values: Optional[np.ndarray] = None) -> pd.DataFrame:
+    """
+    Agrega leads, MQLs e investimento por criativo e calcula as métricas derivadas.
     
-    logger.info(f"Processando arquivo: {file.filename}")
+    Clean Code: Fonte única do groupby de criativos usado por /upload e /google-ads-upload.
     
-    # Lê o arquivo com otimizações
-    file_bytes = file.read()
-    cache_key = _get_cache_key(file_bytes)
-    cached_data = _get_from_cache(cache_key, cache_type='upload')
+    Args:
+        df: DataFrame já processado (a coluna de criativo vira category)
+        creative_col: Coluna usada como chave do criativo
+        lead_values: Leads por linha (array float alinhado a df)
+        mql_values: MQLs por linha (0 quando ausente)
+        cost_values: Investimento por linha (0 quando ausente)
+        
+    Returns:
+        DataFrame com uma linha por criativo e a chave renomeada para 'creative'
+    """
+    # Performance: chave categórica; a agregação roda direto sobre os códigos inteiros
+    key = df[creative_col].astype('category')
+    df[creative_col] = key
+    codes = key.cat.codes.to_numpy()
+    valid = codes >= 0
+    group_codes = codes[valid]
+    n_groups = len(key.cat.categories)
+    # Só categorias com linhas entram no resultado (equivalente a observed=True)
+    observed = np.bincount(group_codes, minlength=n_groups) > 0
+    
+    # Performance: somas, arredondamento e métricas derivadas rodam sobre arrays NumPy
+    # e o DataFrame é montado uma única vez, sem round/assign sobre cópias intermediárias
+    lead_values = lead_values[valid]
+    n_observed = int(observed.sum())
+    leads_np = np.round(_grouped_sum(group_codes, lead_values, n_groups)[observed], 2)
+    appearances_np = np.bincount(
+        group_codes, weights=~np.isnan(lead_values), minlength=n_groups
+    )[observed].astype(np.int64)
+    if mql_values is not None:
+        mqls_np = np.round(_grouped_sum(group_codes, mql_values[valid], n_groups)[observed], 2)
+    else:
+        mqls_np = np.zeros(n_observed, dtype=np.int64)
+    if cost_values is not None:
+        investment_np = np.round(_grouped_sum(group_codes, cost_values[valid], n_groups)[observed], 2)
+    else:
+        investment_np = np.zeros(n_observed)
+    
+    # divisão com where= já devolve 0 onde o denominador é 0 (sem replace(inf)/fillna)
+    return pd.DataFrame({
+        'creative': key.cat.categories[observed],
+        'Total_Leads': leads_np,
+        'Qtd_Aparicoes': appearances_np,
+        'Total_MQLs': mqls_np,
+        'Total_Investimento': investment_np,
+        'Leads_por_Aparicao': _safe_divide(leads_np, appearances_np),
+        'MQLs_por_Aparicao': _safe_divide(mqls_np, appearances_np),
+        'Taxa_Conversao_Lead_MQL': _safe_divide(mqls_np * 100, leads_np),
+        'CPL': _safe_divide(investment_np, leads_np),
+        'CPMQL': _safe_divide(investment_np, mqls_np)
+    })
+
+
+def combine_as_category(left: pd.Series, right: pd.Series, sep: str = ' | ') -> pd.Series:
+    """
+    Equivalente categórico de left.astype(str).str.cat(right.astype(str), sep=sep).
     
-    if cached_data:
-        logger.info(f"Cache hit para arquivo: {file.filename}")
-        return jsonify(cached_data)
+    Performance: concatena só os pares distintos (códigos inteiros de factorize),
+    em vez de montar uma string por linha. Linhas com valor ausente ficam NaN.
+    """
+    left_codes, left_uniques = pd.factorize(left)
+    right_codes, right_uniques = pd.factorize(right)
+    valid = (left_codes >= 0) & (right_codes >= 0)
+    width = max(len(right_uniques), 1)
+    pair_keys = left_codes.astype(np.int64) * width + right_codes
+    
+    codes = np.full(len(left), -1, dtype=np.int64)
+    pairs, pair_codes = np.unique(pair_keys[valid], return_inverse=True)
+    left_str = pd.Index(left_uniques).astype(str).to_numpy(dtype=object)
+    right_str = pd.Index(right_uniques).astype(str).to_numpy(dtype=object)
+    labels = left_str[pairs // width] + sep + right_str[pairs % width]
+    # Pares diferentes podem gerar o mesmo texto: np.unique deduplica e ordena as categorias
+    categories, label_codes = np.unique(labels.astype(str), return_inverse=True)
+    codes[valid] = label_codes[pair_codes]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories), index=left.index)
+
+
+def count_distinct_per_group(keys: pd.Series, values: pd.Series) -> pd.Series:
+    """
+    Equivalente a groupby(keys)[values].nunique().sort_index() para values categórico.
     
-    # Processa arquivo
-    file_like = io.BytesIO(file_bytes)
-    try:
-        if file.filename.endswith('.csv'):
-            logger.debug("Lendo arquivo CSV")
-            df = pd.read_csv(file_like, dtype=str, low_memory=False, engine='c')
-        else:
-            logger.debug("Lendo arquivo Excel")
-            try:
-                df = pd.read_excel(file_like, engine='openpyxl', dtype=str)
-            except Exception as excel_error:
-                logger.warning(f"Erro com openpyxl, tentando engine padrão: {excel_error}")
-                file_like.seek(0)
-                df = pd.read_excel(file_like, dtype=str)
-    except pd.errors.EmptyDataError:
-        logger.error(f"Arquivo vazio: {file.filename}")
-        return jsonify({'error': 'O arquivo está vazio ou corrompido'}), 400
-    except pd.errors.ParserError as e:
-        logger.error(f"Erro ao processar arquivo {file.filename}: {e}")
-        return jsonify({'error': 'Erro ao processar arquivo. Verifique o formato.'}), 400
+    Performance: cada par (grupo, código da categoria) vira um inteiro; np.unique
+    elimina pares repetidos e bincount conta os distintos de cada grupo.
+    """
+    group_codes, groups = pd.factorize(keys)
+    value_codes = values.cat.codes.to_numpy()
+    n_values = max(len(values.cat.categories), 1)
+    valid = (group_codes >= 0) & (value_codes >= 0)
+    distinct_pairs = np.unique(group_codes[valid].astype(np.int64) * n_values + value_codes[valid])
+    counts = np.bincount(distinct_pairs // n_values, minlength=len(groups))
+    return pd.Series(counts, index=groups).sort_index()
+
+
+def temporal_records(summary_df: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Converte o resumo por data (colunas Data/Criativos) na lista de registros do JSON."""
+    # Performance: converte as colunas inteiras e monta os registros com zip;
+    # mais rápido que to_dict('records'), que boxeia valor a valor por linha
+    return [
+        {'Data': data, 'Criativos': criativos}
+        for data, criativos in zip(
+            summary_df['Data'].fillna('').astype(str).tolist(),
+            summary_df['Criativos'].fillna(0).astype(int).tolist()
+        )
+    ]
+
+
+def top_creatives_by_leads(creative_stats: pd.DataFrame, limit: int = 10) -> Dict[str, int]:
+    """Mapeia nome do criativo -> total de leads para as primeiras linhas de creative_stats."""
+    # Performance: monta o dicionário a partir das colunas, sem laço por linha
+    head = creative_stats.head(limit)
+    return dict(zip(
+        head['creative'].astype(str).tolist(),
+        head['Total_Leads'].astype(int).tolist()
+    ))
+
+
+def top_mql_position(creative_stats: pd.DataFrame) -> int:
+    """
+    Posição do criativo com mais MQLs; em empate, vence o que tem mais leads.
+    
+    Mesmo critério do idxmax de MQLs sobre creative_stats ordenado por leads,
+    sem ordenar o DataFrame (lexsort só sobre as duas colunas).
+    """
+    order = np.lexsort((-creative_stats['Total_Leads'].to_numpy(), -creative_stats['Total_MQLs'].to_numpy()))
+    return int(order[0])
+
+
+def creative_highlight(creative_stats: pd.DataFrame, position: int,
+                       include_costs: bool = True) -> Dict[str, Any]:
+    """
+    Resumo de um criativo (linha posicional de creative_stats) para top_lead/top_mql_creative.
+    
+    Performance: cada valor é lido direto da sua coluna (iat), sem materializar a
+    linha inteira como Series de dtype object. include_costs=False zera
+    investimento/CPL/CPMQL (planilha do Google Ads não tem custo).
+    """
+    def value(column):
+        return creative_stats[column].iat[position]
+    
+    return {
+        'name': str(value('creative')),
+        'leads': int(value('Total_Leads')),
+        'mqls': int(value('Total_MQLs')),
+        'investimento': float(value('Total_Investimento')) if include_costs else 0.0,
+        'appearances': int(value('Qtd_Aparicoes')),
+        'leads_per_appearance': float(value('Leads_por_Aparicao')),
+        'mqls_per_appearance': float(value('MQLs_por_Aparicao')),
+        'conversion_rate': float(value('Taxa_Conversao_Lead_MQL')),
+        'cpl': float(value('CPL')) if include_costs else 0.0,
+        'cpmql': float(value('CPMQL')) if include_costs else 0.0
+    }
+
+
+def process_dataframe(df: pd.DataFrame) -> Dict[str, Any]:
+    """
+    Pipeline de análise da planilha de criativos (detecção, preenchimento, KPIs e criativos).
+    
+    Clean Code: Fonte única do processamento usado por /upload e /auto-upload.
     
-    # Processa dados
-    date_col = detect_date_column(df)
-    creative_cols = detect_creative_columns(df)
-    cost_cols = detect_cost_columns(df)
-    leads_cols = detect_leads_columns(df)
+    Args:
+        df: DataFrame lido da planilha
+        
+    Returns:
+        Dicionário com o conteúdo de 'data' da resposta
+    """
+    data, df = analyze_dataframe(df)
+    data['raw_data'] = clean_dataframe_for_json(df, max_rows=MAX_ROWS_FOR_JSON)  # Limita para performance
+    return data
+
+
+def analyze_dataframe(df: pd.DataFrame) -> Tuple[Dict[str, Any], pd.DataFrame]:
+    """
+    Executa a análise sem serializar as linhas (usada também pelo upload em streaming).
+    
+    Returns:
+        Tuple (dados da resposta sem 'raw_data', DataFrame processado)
+    """
+    # Performance: nomes normalizados uma única vez para todos os detectores
+    columns = _column_map(df)
+    date_col = detect_date_column(df, columns)
+    creative_cols = detect_creative_columns(df, columns)
+    cost_cols = detect_cost_columns(df, columns)
+    leads_cols = detect_leads_columns(df, columns)
     
     # Processa datas
     if date_col:
-        df['Data_Processada'] = _parse_dates_vectorized(df[date_col])
-    
-    # Otimização: processa apenas colunas necessárias
-    numeric_cols = df.select_dtypes(include=[np.number]).columns
-    if len(numeric_cols) > 0:
-        df[numeric_cols] = df[numeric_cols].fillna(0)
+        df['Data_Processada'] = parse_brazilian_date_series(df[date_col])
     
     # Preenche campos em branco com 0 APÓS detectar as colunas
     df = fill_empty_fields_with_zero(df)
@@ -2565,16 +3069,26 @@ def upload_file():
     # Preenche coluna Term vazia com 'organico'
     df = fill_term_column(df)
     
+    # Performance: colunas-chave de texto viram category uma única vez; o
+    # identificador combinado e o groupby de criativos reaproveitam os códigos
+    for key_col in dict.fromkeys((creative_cols['campaign'], creative_cols['creative'])):
+        if key_col and not pd.api.types.is_numeric_dtype(df[key_col]):
+            df[key_col] = df[key_col].astype('category')
+    
     # Cria identificador único do criativo
+    # Performance: category faz groupby/nunique operarem sobre códigos inteiros
     if creative_cols['campaign'] and creative_cols['creative']:
-        df['Criativo_Completo'] = df[creative_cols['campaign']].astype(str) + " | " + df[creative_cols['creative']].astype(str)
+        df['Criativo_Completo'] = combine_as_category(
+            df[creative_cols['campaign']], df[creative_cols['creative']]
+        )
     
     # Calcula resumos
     summary_data = {}
     
     if date_col:
         if creative_cols['campaign'] and creative_cols['creative']:
-            date_creative_counts = df.groupby('Data_Processada')['Criativo_Completo'].nunique().sort_index()
+            # Performance: distintos por data contados sobre os códigos inteiros da categoria
+            date_creative_counts = count_distinct_per_group(df['Data_Processada'], df['Criativo_Completo'])
         else:
             date_creative_counts = df['Data_Processada'].value_counts().sort_index()
         
@@ -2583,109 +3097,83 @@ def upload_file():
             'Criativos': date_creative_counts.values
         })
         summary_df = summary_df[summary_df['Data'] != ''].reset_index(drop=True)
-        # Performance: to_dict('records') é 3-5x mais rápido que iterrows()
-        temporal_records = summary_df.to_dict('records')
-        # Limpa valores NaN
-        for record in temporal_records:
-            record['Data'] = str(record['Data']) if pd.notna(record['Data']) else ''
-            record['Criativos'] = int(record['Criativos']) if pd.notna(record['Criativos']) else 0
-        summary_data['temporal'] = temporal_records
+        summary_data['temporal'] = temporal_records(summary_df)
+    
+    # Performance: leads, MQLs e custo convertidos uma única vez para arrays NumPy,
+    # reaproveitados nos KPIs e na agregação por criativo (só colunas detectadas)
+    lead_values, mql_values, cost_values = (
+        _numeric_values(df[col]) if col else None
+        for col in (leads_cols.get('lead'), leads_cols.get('mql'), cost_cols.get('total'))
+    )
     
     # Calcula KPIs
     kpis = {}
+    # Performance: uma passada por coluna, reaproveitando a conversão numérica acima
     if leads_cols.get('lead'):
-        try:
-            total_leads = pd.to_numeric(df[leads_cols['lead']], errors='coerce').sum()
-            if pd.isna(total_leads) or total_leads == 0:
-                total_leads = df[leads_cols['lead']].notna().sum()
-        except:
-            total_leads = df[leads_cols['lead']].notna().sum()
-        kpis['total_leads'] = int(total_leads) if not pd.isna(total_leads) else 0
+        kpis['total_leads'] = _sum_or_count(df[leads_cols['lead']], lead_values)
     
     if leads_cols.get('mql'):
-        try:
-            total_mqls = pd.to_numeric(df[leads_cols['mql']], errors='coerce').sum()
-            if pd.isna(total_mqls) or total_mqls == 0:
-                total_mqls = df[leads_cols['mql']].notna().sum()
-        except:
-            total_mqls = df[leads_cols['mql']].notna().sum()
-        kpis['total_mqls'] = int(total_mqls) if not pd.isna(total_mqls) else 0
+        kpis['total_mqls'] = _sum_or_count(df[leads_cols['mql']], mql_values)
     
     if cost_cols.get('total'):
-        investimento = df[cost_cols['total']].sum()
-        kpis['investimento_total'] = float(investimento) if not pd.isna(investimento) else 0.0
+        investimento = float(cost_values.sum())
+        kpis['investimento_total'] = investimento
     
     # Calcula Custo por MQL
     if cost_cols.get('total') and leads_cols.get('mql') and kpis.get('total_mqls', 0) > 0:
-        kpis['custo_por_mql'] = float(investimento) / kpis['total_mqls'] if not pd.isna(investimento) else 0.0
+        kpis['custo_por_mql'] = investimento / kpis['total_mqls']
     else:
         kpis['custo_por_mql'] = 0.0
     
     # Análise de criativos
     creative_analysis = {}
-    logger.debug(f"Colunas de criativo detectadas: {creative_cols}")
-    logger.debug(f"Colunas de leads detectadas: {leads_cols}")
+    logger.debug("Colunas de criativo detectadas: %s", creative_cols)
+    logger.debug("Colunas de leads detectadas: %s", leads_cols)
     
-    if leads_cols.get('lead'):
+    # Performance: sem leads nem MQLs não há o que ranquear; pula groupby e métricas
+    if leads_cols.get('lead') and (kpis.get('total_leads') or kpis.get('total_mqls')):
         # Usar coluna de criativo se disponível, senão usar campanha
         creative_col = creative_cols['creative'] if creative_cols['creative'] else creative_cols['campaign']
-        logger.debug(f"Usando coluna de criativo: {creative_col}")
+        logger.debug("Usando coluna de criativo: %s", creative_col)
         
         # Se não encontrar coluna de criativo, tentar encontrar manualmente
         if not creative_col:
-            for col in df.columns:
-                if col.lower() not in ['data', 'date', 'dia', 'leads', 'mql', 'investimento', 'custo', 'cpl', 'cpmql', 'cpc', 'cpm', 'ctr'] and df[col].dtype == 'object':
-                    creative_col = col
-                    logger.debug(f"Coluna de criativo auto-detectada: {creative_col}")
-                    break
+            # Performance: filtro só pelos dtypes + conjunto de nomes no nível do módulo;
+            # para na primeira coluna de texto válida
+            creative_col = next(
+                (col for col in text_columns(df) if str(col).lower() not in CREATIVE_FALLBACK_STOPWORDS),
+                None
+            )
+            if creative_col:
+                logger.debug("Coluna de criativo auto-detectada: %s", creative_col)
         
         if creative_col:
             # Análise detalhada de criativos
-            logger.debug(f"Analisando criativos com coluna: {creative_col}")
-            creative_stats = df.groupby(creative_col).agg({
-                leads_cols['lead']: ['sum', 'count'],
-                leads_cols['mql']: 'sum' if leads_cols.get('mql') else lambda x: 0,
-                cost_cols['total']: 'sum' if cost_cols.get('total') else lambda x: 0
-            }).round(2)
-            
-            # Flatten column names
-            creative_stats.columns = ['Total_Leads', 'Qtd_Aparicoes', 'Total_MQLs', 'Total_Investimento']
-            creative_stats = creative_stats.reset_index()
+            logger.debug("Analisando criativos com coluna: %s", creative_col)
+            # Clean Code: colunas ausentes não entram na agregação e viram 0 depois
+            creative_stats = build_creative_stats(df, creative_col, lead_values, mql_values, cost_values)
             
-            # Renomear a coluna do criativo para 'creative' para o frontend
-            if creative_col in creative_stats.columns:
-                creative_stats = creative_stats.rename(columns={creative_col: 'creative'})
+            logger.debug("Estatísticas de criativos: %d criativos, %d colunas", *creative_stats.shape)
             
-            logger.debug(f"Estatísticas de criativos: {creative_stats.shape[0]} criativos, {len(creative_stats.columns)} colunas")
-            
-            # Calcula métricas adicionais
-            creative_stats['Leads_por_Aparicao'] = (creative_stats['Total_Leads'] / creative_stats['Qtd_Aparicoes']).round(2)
-            creative_stats['MQLs_por_Aparicao'] = (creative_stats['Total_MQLs'] / creative_stats['Qtd_Aparicoes']).round(2)
-            creative_stats['Taxa_Conversao_Lead_MQL'] = (creative_stats['Total_MQLs'] / creative_stats['Total_Leads'] * 100).round(2)
-            
-            # Calcula custos por criativo
-            creative_stats['CPL'] = (creative_stats['Total_Investimento'] / creative_stats['Total_Leads']).round(2)
-            creative_stats['CPMQL'] = (creative_stats['Total_Investimento'] / creative_stats['Total_MQLs']).round(2)
+            leads_np = creative_stats['Total_Leads'].to_numpy(dtype=float)
+            mqls_np = creative_stats['Total_MQLs'].to_numpy(dtype=float)
+            investment_np = creative_stats['Total_Investimento'].to_numpy(dtype=float)
+            cpl_np = creative_stats['CPL'].to_numpy()
+            cpmql_np = creative_stats['CPMQL'].to_numpy()
             
             # Análise de Performance e Otimização
-            avg_cpl = creative_stats['CPL'].replace([np.inf, -np.inf, np.nan], 0).mean()
-            avg_cpmql = creative_stats['CPMQL'].replace([np.inf, -np.inf, np.nan], 0).mean()
+            avg_cpl = cpl_np.mean() if len(cpl_np) else np.nan
+            avg_cpmql = cpmql_np.mean() if len(cpmql_np) else np.nan
             
             # Identifica criativos com performance abaixo da média
-            creative_stats['Performance_Status'] = 'Bom'
-            creative_stats.loc[
-                (creative_stats['CPL'] > avg_cpl * 1.5) | 
-                (creative_stats['CPMQL'] > avg_cpmql * 1.5) |
-                (creative_stats['Total_Leads'] < 5),
-                'Performance_Status'
-            ] = 'Ruim'
-            
-            creative_stats.loc[
-                (creative_stats['CPL'] <= avg_cpl * 0.7) & 
-                (creative_stats['CPMQL'] <= avg_cpmql * 0.7) &
-                (creative_stats['Total_Leads'] >= 10),
-                'Performance_Status'
-            ] = 'Excelente'
+            # Custo sem leads/MQLs (divisão por zero) conta como custo infinito
+            cpl_high = np.where(leads_np != 0, cpl_np > avg_cpl * 1.5, investment_np > 0)
+            cpmql_high = np.where(mqls_np != 0, cpmql_np > avg_cpmql * 1.5, investment_np > 0)
+            cpl_low = np.where(leads_np != 0, cpl_np <= avg_cpl * 0.7, investment_np < 0)
+            cpmql_low = np.where(mqls_np != 0, cpmql_np <= avg_cpmql * 0.7, investment_np < 0)
+            status = np.where(cpl_high | cpmql_high | (leads_np < 5), 'Ruim', 'Bom')
+            status = np.where(cpl_low & cpmql_low & (leads_np >= 10), 'Excelente', status)
+            creative_stats['Performance_Status'] = status
             
             # Sugestões de otimização
             optimization_suggestions = {
@@ -2699,36 +3187,30 @@ def upload_file():
                 'avg_cpmql': float(avg_cpmql)
             }
             
-            # Substitui inf e NaN por 0
-            creative_stats = creative_stats.replace([np.inf, -np.inf], 0).fillna(0)
-            
-            # Ordena por total de leads
-            creative_stats = creative_stats.sort_values('Total_Leads', ascending=False)
+            # Top 20 por total de leads
+            # Performance: nlargest faz seleção parcial em vez de ordenar todos os criativos
+            top_stats = creative_stats.nlargest(20, 'Total_Leads')
             
-            logger.debug(f"Criativos ordenados: top {min(5, len(creative_stats))} criativos")
+            logger.debug("Criativos ordenados: top %d criativos", min(5, len(top_stats)))
             
-            # Performance: itertuples() é 3-5x mais rápido que iterrows()
-            top_creatives = {}
-            for row in creative_stats.head(10).itertuples(index=False):
-                creative_name = str(row.creative)
-                top_creatives[creative_name] = int(row.Total_Leads)
+            top_creatives = top_creatives_by_leads(top_stats)
             
-            # Criativo com mais leads
-            top_lead_creative = creative_stats.iloc[0] if len(creative_stats) > 0 else None
+            # Criativo com mais leads (top_stats já está ordenado por leads)
+            top_lead_creative = creative_highlight(top_stats, 0) if len(top_stats) > 0 else None
             
-            # Criativo com mais MQLs
-            top_mql_creative = creative_stats.loc[creative_stats['Total_MQLs'].idxmax()] if len(creative_stats) > 0 else None
-            
-            logger.debug(f"Top criativo (leads): {top_lead_creative['creative'] if top_lead_creative is not None else 'N/A'}")
-            logger.debug(f"Top criativo (MQLs): {top_mql_creative['creative'] if top_mql_creative is not None else 'N/A'}")
+            # Criativo com mais MQLs (empate decidido por leads)
+            top_mql_creative = (
+                creative_highlight(creative_stats, top_mql_position(creative_stats))
+                if len(creative_stats) > 0 else None
+            )
             
-            # Estatísticas gerais
-            total_leads_all = creative_stats['Total_Leads'].sum()
-            total_mqls_all = creative_stats['Total_MQLs'].sum()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Top criativo (leads): %s", top_lead_creative['name'] if top_lead_creative is not None else 'N/A')
+                logger.debug("Top criativo (MQLs): %s", top_mql_creative['name'] if top_mql_creative is not None else 'N/A')
             
             creative_analysis = {
                     'top_creatives': top_creatives,
-                    'creative_details': clean_dataframe_for_json(creative_stats.head(20)),  # Top 20 criativos
+                    'creative_details': clean_dataframe_for_json(top_stats),  # Top 20 criativos
                     'optimization_suggestions': optimization_suggestions,
                     'performance_analysis': {
                         'total_creatives': len(creative_stats),
@@ -2738,30 +3220,8 @@ def upload_file():
                         'avg_cpl': float(avg_cpl),
                         'avg_cpmql': float(avg_cpmql)
                     },
-                    'top_lead_creative': {
-                        'name': str(top_lead_creative['creative']) if top_lead_creative is not None else 'N/A',
-                        'leads': int(top_lead_creative['Total_Leads']) if top_lead_creative is not None else 0,
-                        'mqls': int(top_lead_creative['Total_MQLs']) if top_lead_creative is not None else 0,
-                        'investimento': float(top_lead_creative['Total_Investimento']) if top_lead_creative is not None else 0,
-                        'appearances': int(top_lead_creative['Qtd_Aparicoes']) if top_lead_creative is not None else 0,
-                        'leads_per_appearance': float(top_lead_creative['Leads_por_Aparicao']) if top_lead_creative is not None else 0,
-                        'mqls_per_appearance': float(top_lead_creative['MQLs_por_Aparicao']) if top_lead_creative is not None else 0,
-                        'conversion_rate': float(top_lead_creative['Taxa_Conversao_Lead_MQL']) if top_lead_creative is not None else 0,
-                        'cpl': float(top_lead_creative['CPL']) if top_lead_creative is not None else 0,
-                        'cpmql': float(top_lead_creative['CPMQL']) if top_lead_creative is not None else 0
-                    } if top_lead_creative is not None else None,
-                    'top_mql_creative': {
-                        'name': str(top_mql_creative['creative']) if top_mql_creative is not None else 'N/A',
-                        'leads': int(top_mql_creative['Total_Leads']) if top_mql_creative is not None else 0,
-                        'mqls': int(top_mql_creative['Total_MQLs']) if top_mql_creative is not None else 0,
-                        'investimento': float(top_mql_creative['Total_Investimento']) if top_mql_creative is not None else 0,
-                        'appearances': int(top_mql_creative['Qtd_Aparicoes']) if top_mql_creative is not None else 0,
-                        'leads_per_appearance': float(top_mql_creative['Leads_por_Aparicao']) if top_mql_creative is not None else 0,
-                        'mqls_per_appearance': float(top_mql_creative['MQLs_por_Aparicao']) if top_mql_creative is not None else 0,
-                        'conversion_rate': float(top_mql_creative['Taxa_Conversao_Lead_MQL']) if top_mql_creative is not None else 0,
-                        'cpl': float(top_mql_creative['CPL']) if top_mql_creative is not None else 0,
-                        'cpmql': float(top_mql_creative['CPMQL']) if top_mql_creative is not None else 0
-                    } if top_mql_creative is not None else None,
+                    'top_lead_creative': top_lead_creative,
+                    'top_mql_creative': top_mql_creative,
                     'total_creatives': len(creative_stats),
                     'avg_leads_per_creative': float(creative_stats['Total_Leads'].mean()) if len(creative_stats) > 0 else 0,
                     'avg_mqls_per_creative': float(creative_stats['Total_MQLs'].mean()) if len(creative_stats) > 0 else 0
@@ -2770,24 +3230,72 @@ def upload_file():
             logger.debug("Coluna de criativo não encontrada, pulando análise")
             creative_analysis = {}
     
+    return {
+        'columns': list(df.columns),
+        'total_rows': len(df),
+        'date_column': date_col,
+        'creative_columns': creative_cols,
+        'cost_columns': cost_cols,
+        'leads_columns': leads_cols,
+        'summary': summary_data,
+        'kpis': kpis,
+        'creative_analysis': creative_analysis
+    }, df
+
+@app.route('/upload', methods=['POST'])
+@limiter.limit("10 per minute")
+@handle_errors
+def upload_file():
+    """Endpoint para upload de arquivo com validação e tratamento de erros."""
+    logger.info("Upload request received")
+    
+    # Validação de arquivo
+    if 'file' not in request.files:
+        logger.warning("Upload sem arquivo")
+        return json_response({'error': 'Nenhum arquivo enviado'}, 400)
+    
+    file = request.files['file']
+    is_valid, error_msg = validate_file_upload(file)
+    if not is_valid:
+        logger.warning(f"Upload inválido: {error_msg}")
+        return json_response({'error': error_msg}, 400)
+    
+    logger.info(f"Processando arquivo: {file.filename}")
+    
+    # Lê o arquivo com otimizações
+    file_bytes = file.read()
+    cache_key = _get_cache_key(file_bytes)
+    cached_data = _get_from_cache(cache_key, cache_type='upload')
+    
+    if cached_data:
+        logger.info(f"Cache hit para arquivo: {file.filename}")
+        return json_response(cached_data)
+    
+    # Processa arquivo
+    is_csv = file.filename.endswith('.csv')
+    try:
+        logger.debug("Lendo arquivo %s", 'CSV' if is_csv else 'Excel')
+        df = read_analysis_dataframe(file_bytes, is_csv=is_csv, dtype=str)
+    except pd.errors.EmptyDataError:
+        logger.error(f"Arquivo vazio: {file.filename}")
+        return json_response({'error': 'O arquivo está vazio ou corrompido'}, 400)
+    except pd.errors.ParserError as e:
+        logger.error(f"Erro ao processar arquivo {file.filename}: {e}")
+        return json_response({'error': 'Erro ao processar arquivo. Verifique o formato.'}, 400)
+    
+    data, df = analyze_dataframe(df)
+    data['raw_data'] = clean_dataframe_for_json(df, max_rows=MAX_ROWS_FOR_JSON)
     result = {
         'success': True,
-        'data': {
-            'columns': list(df.columns),
-            'total_rows': len(df),
-            'date_column': date_col,
-            'creative_columns': creative_cols,
-            'cost_columns': cost_cols,
-            'leads_columns': leads_cols,
-            'summary': summary_data,
-            'kpis': kpis,
-            'creative_analysis': creative_analysis,
-            'raw_data': clean_dataframe_for_json(df, max_rows=2000)  # Limita para performance
-        }
+        'data': data
     }
     
     # Salva no cache se tiver chave
     if cache_key:
+        # Performance: o DataFrame processado fica em cache para /raw-data
+        # paginar as linhas além da primeira página sem reprocessar o arquivo
+        if _save_to_cache(f'raw:{cache_key}', df, cache_type='raw_data'):
+            data['raw_data_key'] = cache_key
         _save_to_cache(cache_key, result, cache_type='upload')
     
     # Limpa memória
@@ -2795,7 +3303,63 @@ def upload_file():
     gc.collect()
     
     logger.info(f"Upload processado com sucesso: {file.filename}")
-    return jsonify(result)
+    return json_response(result)
+
+@app.route('/raw-data')
+@limiter.limit("30 per minute")
+@handle_errors
+def raw_data_page():
+    """
+    Devolve uma página das linhas processadas de um upload (?key=&offset=&limit=).
+    
+    Performance: /upload responde só com a primeira página de 'raw_data'; as
+    demais são servidas a partir do DataFrame em cache, sem reler a planilha.
+    O cache é o _DATA_CACHE em memória do processo: a chave só vale na mesma
+    instância que atendeu o upload. No Vercel, outra instância responde 404 e o
+    cliente precisa reenviar o arquivo (o painel usa apenas o 'raw_data' de /upload).
+    Com ?format=ndjson as linhas de offset a offset+limit (até MAX_ROWS_FOR_NDJSON)
+    são transmitidas, uma por linha, serializadas bloco a bloco sem montar a
+    resposta inteira; se um bloco falhar, a última linha é um objeto {"error": ...}.
+    """
+    key = request.args.get('key', '')
+    offset = request.args.get('offset', 0, type=int)
+    is_ndjson = request.args.get('format') == 'ndjson'
+    max_limit = MAX_ROWS_FOR_NDJSON if is_ndjson else MAX_ROWS_FOR_JSON
+    limit = request.args.get('limit', max_limit, type=int)
+    if offset < 0 or limit <= 0:
+        return json_response({'error': 'Parâmetros offset/limit inválidos'}, 400)
+    limit = min(limit, max_limit)
+    
+    df = _get_from_cache(f'raw:{key}', cache_type='raw_data') if key else None
+    if df is None:
+        return json_response({'error': 'Dados não encontrados ou expirados. Envie o arquivo novamente.'}, 404)
+    
+    if is_ndjson:
+        rows_df = df.iloc[offset:offset + limit]
+        
+        def generate():
+            try:
+                for start in range(0, len(rows_df), STREAM_CHUNK_ROWS):
+                    chunk = rows_df.iloc[start:start + STREAM_CHUNK_ROWS]
+                    records = clean_dataframe_for_json(chunk, max_rows=STREAM_CHUNK_ROWS)
+                    yield b''.join(_json_bytes(record) + b'\n' for record in records)
+            except Exception as e:
+                # O status 200 já foi enviado: sinaliza o erro numa última linha
+                logger.error("Erro ao transmitir /raw-data (key=%s): %s", key, e, exc_info=True)
+                yield _json_bytes({'error': 'Erro ao serializar as linhas'}) + b'\n'
+        
+        return Response(generate(), mimetype='application/x-ndjson')
+    
+    return json_response({
+        'success': True,
+        'data': {
+            'rows': clean_dataframe_for_json(df.iloc[offset:offset + limit], max_rows=limit),
+            'offset': offset,
+            'limit': limit,
+            'total_rows': len(df),
+            'has_more': offset + limit < len(df)
+        }
+    })
 
 @app.route('/auto-upload')
 def auto_upload():
@@ -2809,238 +3373,42 @@ def auto_upload():
         # Carrega credenciais
         credentials = load_drive_credentials()
         if not credentials:
-            return jsonify({'error': 'Credenciais do Google Drive não encontradas'}), 500
+            return json_response({'error': 'Credenciais do Google Drive não encontradas'}, 500)
+        
+        cache_key = drive_cache_key('auto-upload', file_id, credentials)
+        cached_data = _get_from_cache(cache_key, cache_type='upload')
+        if cached_data:
+            logger.info("Cache hit para a planilha do Drive (arquivo inalterado)")
+            return json_response(cached_data)
         
         # Baixa arquivo do Google Drive
         file_content, file_name = download_file_from_drive(file_id, credentials)
         if not file_content:
-            return jsonify({'error': 'Erro ao baixar arquivo do Google Drive'}), 500
+            return json_response({'error': 'Erro ao baixar arquivo do Google Drive'}, 500)
         
         # Simula upload do arquivo
-        print(f"Upload automático recebido: {file_name}")
+        logger.debug("Upload automático recebido: %s", file_name)
         
         # Processa o arquivo como se fosse um upload normal
         try:
-            df = pd.read_excel(io.BytesIO(file_content))
-            print(f"Arquivo lido com sucesso: {df.shape}")
-            
-            # Processa dados (mesma lógica da função de upload)
-            date_col = detect_date_column(df)
-            creative_cols = detect_creative_columns(df)
-            cost_cols = detect_cost_columns(df)
-            leads_cols = detect_leads_columns(df)
-            
-            # Processa datas
-            if date_col:
-                df['Data_Processada'] = _parse_dates_vectorized(df[date_col])
-            
-            # Preenche campos em branco com 0 APÓS detectar as colunas
-            df = fill_empty_fields_with_zero(df)
-            
-            # Preenche especificamente colunas de leads e MQLs com 0 se estiverem vazias
-            df = fill_lead_mql_columns(df, leads_cols)
-            
-            # Preenche coluna Term vazia com 'organico'
-            df = fill_term_column(df)
-            
-            # Cria identificador único do criativo
-            if creative_cols['campaign'] and creative_cols['creative']:
-                df['Criativo_Completo'] = df[creative_cols['campaign']].astype(str) + " | " + df[creative_cols['creative']].astype(str)
-            
-            # Calcula resumos
-            summary_data = {}
-            
-            if date_col:
-                if creative_cols['campaign'] and creative_cols['creative']:
-                    date_creative_counts = df.groupby('Data_Processada')['Criativo_Completo'].nunique().sort_index()
-                else:
-                    date_creative_counts = df['Data_Processada'].value_counts().sort_index()
-                
-                summary_df = pd.DataFrame({
-                    'Data': date_creative_counts.index,
-                    'Criativos': date_creative_counts.values
-                })
-                summary_df = summary_df[summary_df['Data'] != ''].reset_index(drop=True)
-                # Performance: to_dict('records') é 3-5x mais rápido que iterrows()
-                temporal_records = summary_df.to_dict('records')
-                # Limpa valores NaN
-                for record in temporal_records:
-                    record['Data'] = str(record['Data']) if pd.notna(record['Data']) else ''
-                    record['Criativos'] = int(record['Criativos']) if pd.notna(record['Criativos']) else 0
-                summary_data['temporal'] = temporal_records
-            
-            # Calcula KPIs
-            kpis = {}
-            if leads_cols.get('lead'):
-                try:
-                    total_leads = pd.to_numeric(df[leads_cols['lead']], errors='coerce').sum()
-                    if pd.isna(total_leads) or total_leads == 0:
-                        total_leads = df[leads_cols['lead']].notna().sum()
-                except:
-                    total_leads = df[leads_cols['lead']].notna().sum()
-                kpis['total_leads'] = int(total_leads) if not pd.isna(total_leads) else 0
-            
-            if leads_cols.get('mql'):
-                try:
-                    total_mqls = pd.to_numeric(df[leads_cols['mql']], errors='coerce').sum()
-                    if pd.isna(total_mqls) or total_mqls == 0:
-                        total_mqls = df[leads_cols['mql']].notna().sum()
-                except:
-                    total_mqls = df[leads_cols['mql']].notna().sum()
-                kpis['total_mqls'] = int(total_mqls) if not pd.isna(total_mqls) else 0
-            
-            if cost_cols.get('total'):
-                investimento = df[cost_cols['total']].sum()
-                kpis['investimento_total'] = float(investimento) if not pd.isna(investimento) else 0.0
-            
-            # Calcula Custo por MQL
-            if cost_cols.get('total') and leads_cols.get('mql') and kpis.get('total_mqls', 0) > 0:
-                kpis['custo_por_mql'] = float(investimento) / kpis['total_mqls'] if not pd.isna(investimento) else 0.0
-            else:
-                kpis['custo_por_mql'] = 0.0
-            
-            # Análise de criativos
-            creative_analysis = {}
-            print(f"Creative columns detected: {creative_cols}")
-            print(f"Leads columns detected: {leads_cols}")
-            
-            if leads_cols.get('lead'):
-                # Usar coluna de criativo se disponível, senão usar campanha
-                creative_col = creative_cols['creative'] if creative_cols['creative'] else creative_cols['campaign']
-                print(f"Using creative column: {creative_col}")
-                
-                # Se não encontrar coluna de criativo, tentar encontrar manualmente
-                if not creative_col:
-                    for col in df.columns:
-                        if col.lower() not in ['data', 'date', 'dia', 'leads', 'mql', 'investimento', 'custo', 'cpl', 'cpmql', 'cpc', 'cpm', 'ctr'] and df[col].dtype == 'object':
-                            creative_col = col
-                            print(f"Auto-detected creative column: {creative_col}")
-                            break
-                
-                if creative_col:
-                    # Análise detalhada de criativos
-                    print(f"Analyzing creatives with column: {creative_col}")
-                    creative_stats = df.groupby(creative_col).agg({
-                        leads_cols['lead']: ['sum', 'count'],
-                        leads_cols['mql']: 'sum' if leads_cols.get('mql') else lambda x: 0,
-                        cost_cols['total']: 'sum' if cost_cols.get('total') else lambda x: 0
-                    }).round(2)
-                
-                    # Flatten column names
-                    creative_stats.columns = ['Total_Leads', 'Qtd_Aparicoes', 'Total_MQLs', 'Total_Investimento']
-                    creative_stats = creative_stats.reset_index()
-                    
-                    # Renomear a coluna do criativo para 'creative' para o frontend
-                    if creative_col in creative_stats.columns:
-                        creative_stats = creative_stats.rename(columns={creative_col: 'creative'})
-                    
-                    print(f"Creative stats shape: {creative_stats.shape}")
-                    print(f"Creative stats columns: {creative_stats.columns.tolist()}")
-                    print(f"Creative stats sample:")
-                    print(creative_stats.head())
-                    
-                    # Calcula métricas adicionais
-                    creative_stats['Leads_por_Aparicao'] = (creative_stats['Total_Leads'] / creative_stats['Qtd_Aparicoes']).round(2)
-                    creative_stats['MQLs_por_Aparicao'] = (creative_stats['Total_MQLs'] / creative_stats['Qtd_Aparicoes']).round(2)
-                    creative_stats['Taxa_Conversao_Lead_MQL'] = (creative_stats['Total_MQLs'] / creative_stats['Total_Leads'] * 100).round(2)
-                    
-                    # Calcula custos por criativo
-                    creative_stats['CPL'] = (creative_stats['Total_Investimento'] / creative_stats['Total_Leads']).round(2)
-                    creative_stats['CPMQL'] = (creative_stats['Total_Investimento'] / creative_stats['Total_MQLs']).round(2)
-                    
-                    # Substitui inf e NaN por 0
-                    creative_stats = creative_stats.replace([np.inf, -np.inf], 0).fillna(0)
-                    
-                    # Ordena por total de leads
-                    creative_stats = creative_stats.sort_values('Total_Leads', ascending=False)
-                    
-                    print(f"Sorted creative stats:")
-                    print(creative_stats.head())
-                    
-                    # Top criativos para gráfico - otimizado
-                    top_creatives = {}
-                    top_10 = creative_stats.head(10)
-                    if len(top_10) > 0:
-                        top_creatives = dict(zip(
-                            top_10['creative'].astype(str),
-                            top_10['Total_Leads'].astype(int)
-                        ))
-                    
-                    # Criativo com mais leads
-                    top_lead_creative = creative_stats.iloc[0] if len(creative_stats) > 0 else None
-                    
-                    # Criativo com mais MQLs
-                    top_mql_creative = creative_stats.loc[creative_stats['Total_MQLs'].idxmax()] if len(creative_stats) > 0 else None
-                    
-                    print(f"Top lead creative: {top_lead_creative['creative'] if top_lead_creative is not None else 'None'}")
-                    print(f"Top MQL creative: {top_mql_creative['creative'] if top_mql_creative is not None else 'None'}")
-                    
-                    # Estatísticas gerais
-                    total_leads_all = creative_stats['Total_Leads'].sum()
-                    total_mqls_all = creative_stats['Total_MQLs'].sum()
-                    
-                    creative_analysis = {
-                        'top_creatives': top_creatives,
-                        'creative_details': clean_dataframe_for_json(creative_stats.head(20)),  # Top 20 criativos
-                        'top_lead_creative': {
-                            'name': str(top_lead_creative['creative']) if top_lead_creative is not None else 'N/A',
-                            'leads': int(top_lead_creative['Total_Leads']) if top_lead_creative is not None else 0,
-                            'mqls': int(top_lead_creative['Total_MQLs']) if top_lead_creative is not None else 0,
-                            'investimento': float(top_lead_creative['Total_Investimento']) if top_lead_creative is not None else 0,
-                            'appearances': int(top_lead_creative['Qtd_Aparicoes']) if top_lead_creative is not None else 0,
-                            'leads_per_appearance': float(top_lead_creative['Leads_por_Aparicao']) if top_lead_creative is not None else 0,
-                            'mqls_per_appearance': float(top_lead_creative['MQLs_por_Aparicao']) if top_lead_creative is not None else 0,
-                            'conversion_rate': float(top_lead_creative['Taxa_Conversao_Lead_MQL']) if top_lead_creative is not None else 0,
-                            'cpl': float(top_lead_creative['CPL']) if top_lead_creative is not None else 0,
-                            'cpmql': float(top_lead_creative['CPMQL']) if top_lead_creative is not None else 0
-                        } if top_lead_creative is not None else None,
-                        'top_mql_creative': {
-                            'name': str(top_mql_creative['creative']) if top_mql_creative is not None else 'N/A',
-                            'leads': int(top_mql_creative['Total_Leads']) if top_mql_creative is not None else 0,
-                            'mqls': int(top_mql_creative['Total_MQLs']) if top_mql_creative is not None else 0,
-                            'investimento': float(top_mql_creative['Total_Investimento']) if top_mql_creative is not None else 0,
-                            'appearances': int(top_mql_creative['Qtd_Aparicoes']) if top_mql_creative is not None else 0,
-                            'leads_per_appearance': float(top_mql_creative['Leads_por_Aparicao']) if top_mql_creative is not None else 0,
-                            'mqls_per_appearance': float(top_mql_creative['MQLs_por_Aparicao']) if top_mql_creative is not None else 0,
-                            'conversion_rate': float(top_mql_creative['Taxa_Conversao_Lead_MQL']) if top_mql_creative is not None else 0,
-                            'cpl': float(top_mql_creative['CPL']) if top_mql_creative is not None else 0,
-                            'cpmql': float(top_mql_creative['CPMQL']) if top_mql_creative is not None else 0
-                        } if top_mql_creative is not None else None,
-                        'total_creatives': len(creative_stats),
-                        'avg_leads_per_creative': float(creative_stats['Total_Leads'].mean()) if len(creative_stats) > 0 else 0,
-                        'avg_mqls_per_creative': float(creative_stats['Total_MQLs'].mean()) if len(creative_stats) > 0 else 0
-                    }
-                else:
-                    print("No creative column found, skipping creative analysis")
-                    creative_analysis = {}
+            # Clean Code: fecha o arquivo temporário do download assim que a leitura termina
+            with file_content:
+                df = read_analysis_dataframe(file_content)
+            logger.debug("Arquivo lido com sucesso: %s", df.shape)
             
             result = {
-                'success': True,
-                'data': {
-                    'columns': list(df.columns),
-                    'total_rows': len(df),
-                    'date_column': date_col,
-                    'creative_columns': creative_cols,
-                    'cost_columns': cost_cols,
-                    'leads_columns': leads_cols,
-                    'summary': summary_data,
-                    'kpis': kpis,
-                    'creative_analysis': creative_analysis,
-                        'raw_data': clean_dataframe_for_json(df, max_rows=2000)  # Limita para performance
-                }
-            }
-            
-            return jsonify({
                 'success': True,
                 'message': f'Planilha {file_name} carregada automaticamente do Google Drive!',
-                'data': result['data']
-            })
+                'data': process_dataframe(df)
+            }
+            _save_to_cache(cache_key, result, cache_type='upload')
+            return json_response(result)
         except Exception as e:
             logger.error(f"Erro ao processar arquivo em auto_upload: {e}", exc_info=True)
-            return jsonify({'error': f'Erro ao processar arquivo: {str(e)}'}), 500
+            return json_response({'error': f'Erro ao processar arquivo: {str(e)}'}, 500)
     except Exception as e:
         logger.error(f"Erro no auto_upload: {e}", exc_info=True)
-        return jsonify({'error': f'Erro no upload automático: {str(e)}'}), 500
+        return json_response({'error': f'Erro no upload automático: {str(e)}'}, 500)
 
 @app.route('/google-ads-upload')
 def google_ads_upload():
@@ -3052,7 +3420,13 @@ def google_ads_upload():
         # Carrega credenciais
         credentials = load_drive_credentials()
         if not credentials:
-            return jsonify({'error': 'Credenciais do Google Drive não encontradas'}), 500
+            return json_response({'error': 'Credenciais do Google Drive não encontradas'}, 500)
+        
+        cache_key = drive_cache_key('google-ads-upload', file_id, credentials)
+        cached_data = _get_from_cache(cache_key, cache_type='upload')
+        if cached_data:
+            logger.info("[GOOGLE ADS] Cache hit (planilha inalterada no Drive)")
+            return json_response(cached_data)
         
         preferred_tabs = ['Controle Google ADS', 'Controle Google ADS 2']
         preferred_targets = [normalize_sheet_title(name) for name in preferred_tabs]
@@ -3066,19 +3440,23 @@ def google_ads_upload():
             sheets_data, sheet_info = load_google_ads_sheet(file_id, credentials, preferred_sheets=preferred_tabs)
             loaded_tabs = ', '.join(sheet_info.get('loaded_sheets', []))
             file_name = f"Google Ads ({loaded_tabs}) via Sheets API"
-            print(f"[GOOGLE ADS] Planilha carregada via Sheets API: {loaded_tabs}")
+            logger.debug("[GOOGLE ADS] Planilha carregada via Sheets API: %s", loaded_tabs)
         except Exception as sheets_error:
-            print(f"[GOOGLE ADS] Falha ao ler via Sheets API: {sheets_error}")
+            logger.warning(f"[GOOGLE ADS] Falha ao ler via Sheets API: {sheets_error}")
             # Fallback: baixar arquivo convertido (XLSX) do Drive
             file_content, downloaded_name = download_file_from_drive(file_id, credentials)
             if not file_content:
-                return jsonify({'error': 'Erro ao baixar arquivo do Google Drive'}), 500
+                return json_response({'error': 'Erro ao baixar arquivo do Google Drive'}, 500)
             
             file_name = downloaded_name or file_name
             logger.info(f"Upload automático do Google Ads recebido: {file_name}")
             
             try:
-                sheets_dict = pd.read_excel(io.BytesIO(file_content), sheet_name=None)
+                # Performance: lê só os nomes das abas e faz o parse apenas das abas usadas
+                with file_content, pd.ExcelFile(_as_file_like(file_content), engine=EXCEL_ENGINE) as workbook:
+                    wanted_sheets = [name for name in workbook.sheet_names
+                                     if normalize_sheet_title(name) in preferred_targets]
+                    sheets_dict = workbook.parse(sheet_name=wanted_sheets) if wanted_sheets else {}
             except Exception as read_error:
                 raise ValueError(f"Não foi possível ler o arquivo baixado: {read_error}")
             
@@ -3093,7 +3471,7 @@ def google_ads_upload():
                     continue
                 frames_map[sheet_name] = cleaned_df
                 sheet_stats.append({'name': sheet_name, 'rows': int(cleaned_df.shape[0]), 'columns': int(cleaned_df.shape[1])})
-                print(f"[GOOGLE ADS][Download] Aba '{sheet_name}' carregada -> linhas: {cleaned_df.shape[0]}, colunas: {cleaned_df.shape[1]}")
+                logger.debug("[GOOGLE ADS][Download] Aba '%s' carregada -> linhas: %d, colunas: %d", sheet_name, *cleaned_df.shape)
             
             if not frames_map:
                 raise ValueError("Nenhuma das abas solicitadas possuía dados válidos no arquivo baixado do Google Ads.")
@@ -3105,7 +3483,7 @@ def google_ads_upload():
                 'sheet_count': len(frames_map),
                 'loaded_sheets': list(frames_map.keys())
             }
-            print(f"Arquivo do Google Ads lido via download: {[k for k in frames_map.keys()]}")
+            logger.debug("Arquivo do Google Ads lido via download: %s", list(frames_map))
         
         def pick_sheet(target_name):
             normalized_target = normalize_sheet_title(target_name)
@@ -3118,13 +3496,13 @@ def google_ads_upload():
         funnels_df = pick_sheet('Controle Google ADS 2')
         
         if leads_df is None or leads_df.empty:
-            return jsonify({'error': "Aba 'Controle Google ADS' não encontrada ou está vazia"}), 500
+            return json_response({'error': "Aba 'Controle Google ADS' não encontrada ou está vazia"}, 500)
         
         df = leads_df.copy().reset_index(drop=True)
         
         # Processa o DataFrame independentemente da origem
         try:
-            print("Colunas da planilha:", list(df.columns))
+            logger.debug("Colunas da planilha: %s", df.columns.tolist())
             
             # Processa APENAS as colunas necessárias: Dia, MQL?, Term
             # Define estruturas vazias para não quebrar
@@ -3134,8 +3512,8 @@ def google_ads_upload():
             # Detecta coluna de data
             date_col = detect_date_column(df)
             if date_col:
-                df['Data_Processada'] = _parse_dates_vectorized(df[date_col])
-                print(f"Coluna de data detectada: {date_col}")
+                df['Data_Processada'] = parse_brazilian_date_series(df[date_col])
+                logger.debug("Coluna de data detectada: %s", date_col)
             
             # Preenche coluna Term vazia com 'organico'
             df = fill_term_column(df)
@@ -3144,11 +3522,11 @@ def google_ads_upload():
             has_mql_col, lead_count_col, mql_count_col = process_mql_column_to_leads(df)
             
             if not has_mql_col:
-                return jsonify({'error': 'Coluna MQL? não encontrada na planilha'}), 500
+                return json_response({'error': 'Coluna MQL? não encontrada na planilha'}, 500)
             
             # Usa as colunas de contagem criadas
             leads_cols = {'lead': lead_count_col, 'mql': mql_count_col}
-            print(f"Usando colunas de contagem: {leads_cols}")
+            logger.debug("Usando colunas de contagem: %s", leads_cols)
             
             # Calcula resumos baseado em Data_Processada
             summary_data = {}
@@ -3161,13 +3539,7 @@ def google_ads_upload():
                     'Criativos': date_counts.values
                 })
                 summary_df = summary_df[summary_df['Data'] != ''].reset_index(drop=True)
-                # Performance: to_dict('records') é 3-5x mais rápido que iterrows()
-                temporal_records = summary_df.to_dict('records')
-                # Limpa valores NaN
-                for record in temporal_records:
-                    record['Data'] = str(record['Data']) if pd.notna(record['Data']) else ''
-                    record['Criativos'] = int(record['Criativos']) if pd.notna(record['Criativos']) else 0
-                summary_data['temporal'] = temporal_records
+                summary_data['temporal'] = temporal_records(summary_df)
                 
                 # Comparação temporal para Google Ads
                 if not summary_df.empty:
@@ -3222,75 +3594,41 @@ def google_ads_upload():
             creative_analysis = {}
             
             # Encontra coluna Term para usar como criativo
-            term_col = None
-            for col in df.columns:
-                if col.lower() == 'term':
-                    term_col = col
-                    break
+            term_col = find_term_column(df)
             
-            if term_col and leads_cols.get('lead'):
+            # Performance: sem leads nem MQLs não há o que ranquear; pula groupby e métricas
+            if term_col and leads_cols.get('lead') and (kpis['total_leads'] or kpis['total_mqls']):
                 # Análise detalhada de criativos usando Term
-                print(f"Analyzing creatives with column: {term_col}")
-                if leads_cols.get('mql'):
-                    creative_stats = df.groupby(term_col).agg({
-                        leads_cols['lead']: ['sum', 'count'],
-                        leads_cols['mql']: 'sum'
-                    }).round(2)
-                    # Flatten column names
-                    creative_stats.columns = ['Total_Leads', 'Qtd_Aparicoes', 'Total_MQLs']
-                else:
-                    creative_stats = df.groupby(term_col).agg({
-                        leads_cols['lead']: ['sum', 'count']
-                    }).round(2)
-                    # Flatten column names
-                    creative_stats.columns = ['Total_Leads', 'Qtd_Aparicoes']
-                    creative_stats['Total_MQLs'] = 0
-                
-                creative_stats = creative_stats.reset_index()
-                
-                # Renomear a coluna do criativo para 'creative' para o frontend
-                creative_stats = creative_stats.rename(columns={term_col: 'creative'})
-                
-                # Adiciona coluna de investimento vazia
-                creative_stats['Total_Investimento'] = 0.0
-                
-                print(f"Creative stats shape: {creative_stats.shape}")
-                print(f"Creative stats columns: {creative_stats.columns.tolist()}")
-                print(f"Creative stats sample:")
-                print(creative_stats.head())
-                
-                # Calcula métricas adicionais
-                creative_stats['Leads_por_Aparicao'] = (creative_stats['Total_Leads'] / creative_stats['Qtd_Aparicoes']).round(2)
-                creative_stats['MQLs_por_Aparicao'] = (creative_stats['Total_MQLs'] / creative_stats['Qtd_Aparicoes']).round(2) if leads_cols.get('mql') else 0
-                creative_stats['Taxa_Conversao_Lead_MQL'] = (creative_stats['Total_MQLs'] / creative_stats['Total_Leads'] * 100).round(2) if leads_cols.get('mql') else 0
-                
-                # Calcula custos por criativo (sempre 0)
-                creative_stats['CPL'] = 0.0
-                creative_stats['CPMQL'] = 0.0
-                
-                # Substitui inf e NaN por 0
-                creative_stats = creative_stats.replace([np.inf, -np.inf], 0).fillna(0)
+                logger.debug("Analyzing creatives with column: %s", term_col)
+                # Sem coluna de custo nesta aba: investimento, CPL e CPMQL ficam em 0
+                creative_stats = build_creative_stats(
+                    df, term_col, df[leads_cols['lead']].to_numpy(dtype=float),
+                    df[leads_cols['mql']].to_numpy(dtype=float) if leads_cols.get('mql') else None
+                )
                 
-                # Ordena por total de leads
-                creative_stats = creative_stats.sort_values('Total_Leads', ascending=False)
+                logger.debug("Creative stats shape: %s", creative_stats.shape)
+                logger.debug("Creative stats columns: %s", creative_stats.columns.tolist())
                 
-                print(f"Sorted creative stats:")
-                print(creative_stats.head())
+                # Top 20 por total de leads
+                # Performance: nlargest faz seleção parcial em vez de ordenar todos os criativos
+                top_stats = creative_stats.nlargest(20, 'Total_Leads')
                 
-                # Performance: itertuples() é 3-5x mais rápido que iterrows()
-                top_creatives = {}
-                for row in creative_stats.head(10).itertuples(index=False):
-                    creative_name = str(row.creative)
-                    top_creatives[creative_name] = int(row.Total_Leads)
+                top_creatives = top_creatives_by_leads(top_stats)
                 
-                # Criativo com mais leads
-                top_lead_creative = creative_stats.iloc[0] if len(creative_stats) > 0 else None
+                # Criativo com mais leads (top_stats já está ordenado por leads)
+                top_lead_creative = (
+                    creative_highlight(top_stats, 0, include_costs=False) if len(top_stats) > 0 else None
+                )
                 
-                # Criativo com mais MQLs
-                top_mql_creative = creative_stats.loc[creative_stats['Total_MQLs'].idxmax()] if len(creative_stats) > 0 else None
+                # Criativo com mais MQLs (empate decidido por leads)
+                top_mql_creative = (
+                    creative_highlight(creative_stats, top_mql_position(creative_stats), include_costs=False)
+                    if len(creative_stats) > 0 else None
+                )
                 
-                print(f"Top lead creative: {top_lead_creative['creative'] if top_lead_creative is not None else 'None'}")
-                print(f"Top MQL creative: {top_mql_creative['creative'] if top_mql_creative is not None else 'None'}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Top lead creative: %s", top_lead_creative['name'] if top_lead_creative is not None else 'None')
+                    logger.debug("Top MQL creative: %s", top_mql_creative['name'] if top_mql_creative is not None else 'None')
                 
                 # Estatísticas gerais
                 total_leads_all = creative_stats['Total_Leads'].sum()
@@ -3298,37 +3636,15 @@ def google_ads_upload():
                 
                 creative_analysis = {
                     'top_creatives': top_creatives,
-                    'creative_details': clean_dataframe_for_json(creative_stats.head(20)),
-                    'top_lead_creative': {
-                        'name': str(top_lead_creative['creative']) if top_lead_creative is not None else 'N/A',
-                        'leads': int(top_lead_creative['Total_Leads']) if top_lead_creative is not None else 0,
-                        'mqls': int(top_lead_creative['Total_MQLs']) if top_lead_creative is not None else 0,
-                        'investimento': 0.0,
-                        'appearances': int(top_lead_creative['Qtd_Aparicoes']) if top_lead_creative is not None else 0,
-                        'leads_per_appearance': float(top_lead_creative['Leads_por_Aparicao']) if top_lead_creative is not None else 0,
-                        'mqls_per_appearance': float(top_lead_creative['MQLs_por_Aparicao']) if top_lead_creative is not None else 0,
-                        'conversion_rate': float(top_lead_creative['Taxa_Conversao_Lead_MQL']) if top_lead_creative is not None else 0,
-                        'cpl': 0.0,
-                        'cpmql': 0.0
-                    } if top_lead_creative is not None else None,
-                    'top_mql_creative': {
-                        'name': str(top_mql_creative['creative']) if top_mql_creative is not None else 'N/A',
-                        'leads': int(top_mql_creative['Total_Leads']) if top_mql_creative is not None else 0,
-                        'mqls': int(top_mql_creative['Total_MQLs']) if top_mql_creative is not None else 0,
-                        'investimento': 0.0,
-                        'appearances': int(top_mql_creative['Qtd_Aparicoes']) if top_mql_creative is not None else 0,
-                        'leads_per_appearance': float(top_mql_creative['Leads_por_Aparicao']) if top_mql_creative is not None else 0,
-                        'mqls_per_appearance': float(top_mql_creative['MQLs_por_Aparicao']) if top_mql_creative is not None else 0,
-                        'conversion_rate': float(top_mql_creative['Taxa_Conversao_Lead_MQL']) if top_mql_creative is not None else 0,
-                        'cpl': 0.0,
-                        'cpmql': 0.0
-                    } if top_mql_creative is not None else None,
+                    'creative_details': clean_dataframe_for_json(top_stats),
+                    'top_lead_creative': top_lead_creative,
+                    'top_mql_creative': top_mql_creative,
                     'total_creatives': len(creative_stats),
                     'avg_leads_per_creative': float(creative_stats['Total_Leads'].mean()) if len(creative_stats) > 0 else 0,
                     'avg_mqls_per_creative': float(creative_stats['Total_MQLs'].mean()) if len(creative_stats) > 0 else 0
                 }
             else:
-                print("No Term column found, skipping creative analysis")
+                logger.debug("No Term column or no leads/MQLs, skipping creative analysis")
                 creative_analysis = {}
             
             result = {
@@ -3349,22 +3665,26 @@ def google_ads_upload():
                     'raw_data': clean_dataframe_for_json(df)
                 }
             }
+            # Performance: as linhas além da primeira página ficam disponíveis em /raw-data
+            raw_key = _get_cache_key(cache_key) if cache_key else None
+            if raw_key and _save_to_cache(f'raw:{raw_key}', df, cache_type='raw_data'):
+                result['data']['raw_data_key'] = raw_key
             
-            return jsonify({
+            response_data = {
                 'success': True,
                 'message': f'Planilha do Google Ads {file_name} carregada automaticamente!',
                 'data': result['data']
-            })
+            }
+            _save_to_cache(cache_key, response_data, cache_type='upload')
+            return json_response(response_data)
                 
         except Exception as e:
-            print(f"Erro ao processar arquivo Excel do Google Ads: {str(e)}")
-            import traceback
-            traceback.print_exc()
-            return jsonify({'error': f'Erro ao processar arquivo: {str(e)}'}), 500
+            logger.error(f"Erro ao processar arquivo Excel do Google Ads: {str(e)}", exc_info=True)
+            return json_response({'error': f'Erro ao processar arquivo: {str(e)}'}, 500)
             
     except Exception as e:
-        print(f"Erro no upload automático do Google Ads: {str(e)}")
-        return jsonify({'error': f'Erro no upload automático do Google Ads: {str(e)}'}), 500
+        logger.error(f"Erro no upload automático do Google Ads: {str(e)}")
+        return json_response({'error': f'Erro no upload automático do Google Ads: {str(e)}'}, 500)
 
 @app.route('/download/<filename>')
 def download_file(filename):
@@ -3384,7 +3704,16 @@ def auto_upload_leads():
 
         credentials = load_drive_credentials()
         if not credentials:
-            return jsonify({'error': 'Credenciais do Google Drive não encontradas'}), 500
+            return json_response({'error': 'Credenciais do Google Drive não encontradas'}, 500)
+
+        # Performance: planilha inalterada (mesmo modifiedTime) reaproveita a análise anterior;
+        # o modifiedTime fica memorizado por DRIVE_MODIFIED_TIME_TTL_SECONDS e é compartilhado
+        # com /auto-upload quando LEADS_FILE_ID cai no mesmo DRIVE_FILE_ID
+        cache_key = drive_cache_key('auto-upload-leads', file_id, credentials)
+        cached_data = _get_from_cache(cache_key, cache_type='leads')
+        if cached_data:
+            logger.info("Cache hit para a planilha de leads do Drive (arquivo inalterado)")
+            return json_response(cached_data)
 
         df = None
         sheet_info = None
@@ -3393,16 +3722,17 @@ def auto_upload_leads():
         try:
             df, sheet_info = load_leads_dataframe_from_google_sheets(file_id, credentials, priority_names)
             file_name = sheet_info.get('primary_sheet', 'Google Sheet')
-            print(f"[LEADS] Carregado via Sheets API com {sheet_info.get('combined_rows', len(df))} linhas." )
+            logger.debug(f"[LEADS] Carregado via Sheets API com {sheet_info.get('combined_rows', len(df))} linhas.")
         except Exception as sheet_error:
             logger.warning(f"Falha Sheets API, tentando exportação XLSX: {sheet_error}")
 
         if df is None:
             file_content, file_name = download_file_from_drive(file_id, credentials)
             if not file_content:
-                return jsonify({'error': 'Erro ao baixar arquivo de leads do Google Drive'}), 500
+                return json_response({'error': 'Erro ao baixar arquivo de leads do Google Drive'}, 500)
 
-            df, sheet_info = load_leads_dataframe_from_bytes(file_content, file_name, priority_names)
+            with file_content:
+                df, sheet_info = load_leads_dataframe_from_bytes(file_content, file_name, priority_names)
 
         sheet_info = sheet_info or {}
         sheet_info['file_name'] = file_name
@@ -3413,15 +3743,17 @@ def auto_upload_leads():
         analysis['file_name'] = file_name
 
         logger.info(f"Leads carregados automaticamente: {file_name}")
-        return jsonify({
+        result = {
             'success': True,
             'message': f'Planilha de leads {file_name} carregada automaticamente!',
             'sheet_info': sheet_info,
             'data': analysis
-        })
+        }
+        _save_to_cache(cache_key, result, cache_type='leads')
+        return json_response(result)
     except Exception as e:
         logger.error(f"Erro no auto_upload_leads: {e}", exc_info=True)
-        return jsonify({'error': f'Erro no upload automático de leads: {str(e)}'}), 500
+        return json_response({'error': f'Erro no upload automático de leads: {str(e)}'}, 500)
 
 @app.route('/upload-leads', methods=['POST'])
 @limiter.limit("10 per minute")
@@ -3433,13 +3765,13 @@ def upload_leads():
     # Validação de arquivo
     if 'file' not in request.files:
         logger.warning("Upload de leads sem arquivo")
-        return jsonify({'error': 'Nenhum arquivo enviado'}), 400
+        return json_response({'error': 'Nenhum arquivo enviado'}, 400)
 
     file = request.files['file']
     is_valid, error_msg = validate_file_upload(file)
     if not is_valid:
         logger.warning(f"Upload de leads inválido: {error_msg}")
-        return jsonify({'error': error_msg}), 400
+        return json_response({'error': error_msg}, 400)
 
     priority_env = os.getenv('LEADS_SHEETS_PRIORITY', '')
     priority_names = [name.strip() for name in priority_env.split(',')] if priority_env else []
@@ -3450,7 +3782,7 @@ def upload_leads():
     
     if cached_data:
         logger.info(f"Cache hit para leads: {file.filename}")
-        return jsonify(cached_data)
+        return json_response(cached_data)
     
     df, sheet_info = load_leads_dataframe_from_bytes(file_bytes, file.filename, priority_names)
     sheet_info = sheet_info or {}
@@ -3478,7 +3810,7 @@ def upload_leads():
     gc.collect()
 
     logger.info(f"Leads processados com sucesso: {file.filename}")
-    return jsonify(result)
+    return json_response(result)
 
 @app.route('/api/sults/test', methods=['GET'])
 def test_sults_connection():
@@ -3711,9 +4043,9 @@ def verificar_sults_leads():
                 negocios = client.get_negocios_franqueados()
                 if negocios:
                     projetos = negocios
-                    print(f"✅ Encontrados {len(negocios)} negócios de franqueados via expansão")
+                    logger.debug("Encontrados %d negócios de franqueados via expansão", len(negocios))
             except Exception as e:
-                print(f"⚠️ Erro ao buscar negócios via expansão: {e}")
+                logger.warning("Erro ao buscar negócios via expansão: %s", e)
             
             # Se não encontrou via expansão, buscar projetos e filtrar
             if not projetos:
@@ -3739,7 +4071,7 @@ def verificar_sults_leads():
                         projetos_franqueados.append(projeto)
                 
                 projetos = projetos_franqueados
-                print(f"✅ Encontrados {len(projetos)} projetos de franqueados após filtro (lojas excluídas)")
+                logger.debug("Encontrados %d projetos de franqueados após filtro (lojas excluídas)", len(projetos))
             
             # Filtro final para garantir que não há lojas
             projetos_filtrados_final = []
@@ -3761,7 +4093,7 @@ def verificar_sults_leads():
                     projetos_filtrados_final.append(projeto)
             
             projetos = projetos_filtrados_final
-            print(f"✅ Após filtro final: {len(projetos)} negócios de franqueados (sem lojas)")
+            logger.debug("Após filtro final: %d negócios de franqueados (sem lojas)", len(projetos))
             
             # Ordem customizada das fases (definir uma vez para otimização)
             ordem_fases = {
@@ -4008,7 +4340,7 @@ def verificar_sults_leads():
             total_leads = len(leads_abertos)
             
             # Log final resumido
-            print(f"✅ Processados: {len(projetos)} projetos → {len(leads_abertos)} leads abertos, {total_mql} MQLs")
+            logger.info("Processados: %d projetos → %d leads abertos, %d MQLs", len(projetos), len(leads_abertos), total_mql)
             
             resultado = {
                 'token_status': token_status,
@@ -4062,9 +4394,7 @@ def verificar_sults_leads():
                 'data': resultado
             })
         except Exception as main_error:
-            print(f"Erro ao buscar dados principais: {main_error}")
-            import traceback
-            traceback.print_exc()
+            logger.error("Erro ao buscar dados principais: %s", main_error, exc_info=True)
             
             # Se falhar, tentar combinações antigas
             priority_combinations = [
@@ -4120,7 +4450,7 @@ def verificar_sults_leads():
                         'auth_format': auth_format,
                         'error': error_msg
                     })
-                    print(f"❌ Falhou: {base_url}{endpoint} ({auth_format}) - {error_msg}")
+                    logger.debug("Falhou: %s%s (%s) - %s", base_url, endpoint, auth_format, error_msg)
                     continue
         
         # Se nenhuma combinação funcionou, retornar erro detalhado
@@ -4142,8 +4472,7 @@ def verificar_sults_leads():
         }), 500
             
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.error("Erro geral em verificar_sults_leads: %s", e, exc_info=True)
         return jsonify({
             'success': False,
             'error': f'Erro geral: {str(e)}'
@@ -4190,8 +4519,7 @@ def get_sults_leads_status():
                 'data': leads_data
             })
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.error("Erro ao buscar status dos leads SULTS: %s", e, exc_info=True)
         error_msg = str(e)
         
         # Se for erro 404, dar instruções mais claras
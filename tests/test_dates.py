@@ -0,0 +1,21 @@
+import pandas as pd
+
+from app_web import parse_brazilian_date_series, to_datetime_dayfirst
+
+
+def test_iso_dates_keep_day_and_month():
+    series = pd.Series(['2025-03-04', '2025-03-25', '2025-03-04 00:00:00'], dtype=object)
+    assert parse_brazilian_date_series(series).tolist() == ['04/03/2025', '25/03/2025', '04/03/2025']
+
+
+def test_iso_and_brazilian_dates_mixed_in_one_column():
+    series = pd.Series(['04/03/2025', '2025-03-04 10:00:00', '2025-03-25', '4/3/2025', None, ''], dtype=object)
+    assert parse_brazilian_date_series(series).tolist() == [
+        '04/03/2025', '04/03/2025', '25/03/2025', '04/03/2025', '', ''
+    ]
+
+
+def test_iso_first_value_does_not_set_day_first_format():
+    series = pd.Series(['2025-03-04', '25/03/2025'], dtype=object)
+    parsed = to_datetime_dayfirst(series)
+    assert parsed.dt.strftime('%d/%m/%Y').tolist() == ['04/03/2025', '25/03/2025']